@@ -27,6 +27,8 @@ setup(
 		"wxPython==4.2.1",
 		"Pillow==10.1.0",
 		"fastapi==0.115.0",
+		"orjson==3.10.7",
+		"msgspec==0.18.6",
 		"uvicorn[standard]==0.30.6",
 		"requests==2.32.3",
 		"typer==0.12.3",
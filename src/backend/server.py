@@ -5,93 +5,121 @@ Run with: uvicorn backend.server:app --reload
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import msgspec
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 
 from . import state
 
 
-app = FastAPI(title="Graph Canvas Backend", version="0.1.0")
+app = FastAPI(
+    title="Graph Canvas Backend",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 
-class GraphPayload(BaseModel):
+class GraphPayload(msgspec.Struct, omit_defaults=True):
+    nodes: List[Dict]
+    edges: List[Dict]
     id: Optional[str] = None
     name: Optional[str] = None
     metadata: Optional[Dict] = None
-    nodes: List[Dict]
-    edges: List[Dict]
     background_color: Optional[List[int]] = None
     grid_visible: Optional[bool] = None
     grid_size: Optional[int] = None
     grid_color: Optional[List[int]] = None
 
 
-class NodePosition(BaseModel):
+class NodePosition(msgspec.Struct):
     id: str
     x: float
     y: float
 
 
-class NewNode(BaseModel):
+class NewNode(msgspec.Struct):
     x: float
     y: float
     text: Optional[str] = ""
 
 
-class NewEdge(BaseModel):
+class NewEdge(msgspec.Struct):
     source_id: str
     target_id: str
     text: Optional[str] = ""
 
 
-@app.get("/health")
-def health() -> Dict[str, str]:
+# Decoders are built once per type so each request reuses the compiled schema.
+_GRAPH_DECODER = msgspec.json.Decoder(GraphPayload)
+_POSITIONS_DECODER = msgspec.json.Decoder(List[NodePosition])
+_POSITIONS_MSGPACK_DECODER = msgspec.msgpack.Decoder(List[Tuple[str, float, float]])
+_NEW_NODE_DECODER = msgspec.json.Decoder(NewNode)
+_NEW_EDGE_DECODER = msgspec.json.Decoder(NewEdge)
+
+
+async def _decode(request: Request, decoder: Union[msgspec.json.Decoder, msgspec.msgpack.Decoder]):
+    try:
+        return decoder.decode(await request.body())
+    except msgspec.DecodeError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+@app.get("/health", response_class=ORJSONResponse, response_model=None)
+async def health():
     return {"status": "ok"}
 
 
-@app.get("/graph")
-def get_graph() -> Dict:
-    return state.get_graph_dict()
+@app.get("/graph", response_class=Response, response_model=None)
+async def get_graph():
+    return Response(await state.get_graph_bytes(), media_type="application/json")
 
 
-@app.post("/graph")
-def set_graph(payload: GraphPayload) -> Dict:
-    state.set_graph_from_dict(payload.dict())
+@app.post("/graph", response_class=ORJSONResponse, response_model=None)
+async def set_graph(request: Request):
+    payload = await _decode(request, _GRAPH_DECODER)
+    await state.set_graph_from_dict(msgspec.to_builtins(payload))
     return {"ok": True}
 
 
-@app.patch("/nodes/positions")
-def patch_node_positions(positions: List[NodePosition]) -> Dict:
-    updated = state.update_node_positions([(p.id, p.x, p.y) for p in positions])
+@app.patch("/nodes/positions", response_class=ORJSONResponse, response_model=None)
+async def patch_node_positions(request: Request):
+    if request.headers.get("content-type", "").startswith("application/msgpack"):
+        # Binary drag payload: [[id, x, y], ...]
+        items = await _decode(request, _POSITIONS_MSGPACK_DECODER)
+    else:
+        items = [(p.id, p.x, p.y) for p in await _decode(request, _POSITIONS_DECODER)]
+    updated = await state.update_node_positions(items)
     return {"updated": updated}
 
 
-@app.post("/nodes")
-def post_node(new_node: NewNode) -> Dict:
-    return state.create_node(new_node.x, new_node.y, new_node.text or "")
+@app.post("/nodes", response_class=ORJSONResponse, response_model=None)
+async def post_node(request: Request):
+    new_node = await _decode(request, _NEW_NODE_DECODER)
+    return await state.create_node(new_node.x, new_node.y, new_node.text or "")
 
 
-@app.delete("/nodes/{node_id}")
-def delete_node(node_id: str) -> Dict:
-    ok = state.delete_node(node_id)
+@app.delete("/nodes/{node_id}", response_class=ORJSONResponse, response_model=None)
+async def delete_node(node_id: str):
+    ok = await state.delete_node(node_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Node not found")
     return {"ok": True}
 
 
-@app.post("/edges")
-def post_edge(new_edge: NewEdge) -> Dict:
+@app.post("/edges", response_class=ORJSONResponse, response_model=None)
+async def post_edge(request: Request):
+    new_edge = await _decode(request, _NEW_EDGE_DECODER)
     try:
-        return state.create_edge(new_edge.source_id, new_edge.target_id, new_edge.text or "")
+        return await state.create_edge(new_edge.source_id, new_edge.target_id, new_edge.text or "")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.delete("/edges/{edge_id}")
-def delete_edge(edge_id: str) -> Dict:
-    ok = state.delete_edge(edge_id)
+@app.delete("/edges/{edge_id}", response_class=ORJSONResponse, response_model=None)
+async def delete_edge(edge_id: str):
+    ok = await state.delete_edge(edge_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Edge not found")
     return {"ok": True}
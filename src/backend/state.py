@@ -1,70 +1,107 @@
 """
-Shared backend state for the graph and thread-safe mutation helpers.
+Shared backend state for the graph and lock-guarded async mutation helpers.
 """
 
 from __future__ import annotations
 
-import threading
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Tuple
 
+import anyio
+import orjson
+
+from graph_canvas.infrastructure.serialization import orjson_default
 from graph_canvas.presentation.desktop.models.graph import Graph
 from graph_canvas.presentation.desktop.models import node as m_node
 from graph_canvas.presentation.desktop.models import edge as m_edge
 
 
-_graph_lock = threading.Lock()
+_write_lock = anyio.Lock()
 current_graph: Graph = Graph(name="Backend Graph")
 
+# Writers bump the version under the lock; readers compare it against the
+# published (version, bytes) snapshot and only lock to re-encode a stale one.
+_version = 0
+_snapshot: Tuple[int, bytes] = (-1, b"")
+
+
+def _touch() -> None:
+    global _version
+    _version += 1
+
+
+async def get_graph_bytes() -> bytes:
+    """Return the current graph as JSON without locking when nothing changed."""
+    snapshot = _snapshot
+    if snapshot[0] == _version:
+        return snapshot[1]
+    return await _publish_snapshot()
 
-def get_graph_dict() -> Dict:
-    with _graph_lock:
-        return current_graph.to_dict()
 
+async def _publish_snapshot() -> bytes:
+    global _snapshot
+    async with _write_lock:
+        if _snapshot[0] != _version:
+            _snapshot = (_version, orjson.dumps(current_graph.to_dict(), default=orjson_default))
+        return _snapshot[1]
 
-def set_graph_from_dict(payload: Dict) -> None:
+
+async def set_graph_from_dict(payload: Dict) -> None:
     global current_graph
-    with _graph_lock:
+    async with _write_lock:
         current_graph = Graph.from_dict(payload)
+        _touch()
+
+
+def _move_nodes(positions: Iterable[Tuple[str, float, float]]) -> int:
+    """Apply (node_id, x, y) moves and return how many nodes moved; caller holds the write lock."""
+    moved = 0
+    for node_id, x, y in positions:
+        node = current_graph.get_node(node_id)
+        if node is None:
+            continue
+        node.set_2d_position(x, y)
+        moved += 1
+    current_graph.modified = True
+    _touch()
+    return moved
 
 
-def update_node_positions(positions: Iterable[Tuple[str, float, float]]) -> List[Dict]:
+async def update_node_positions(positions: Iterable[Tuple[str, float, float]]) -> int:
     """
     Update multiple node positions.
     positions: iterable of (node_id, x, y)
-    Returns list of updated node dicts.
+    Returns the number of nodes updated; clients already hold the new positions.
     """
-    updated: List[Dict] = []
-    with _graph_lock:
-        for node_id, x, y in positions:
-            node = current_graph.get_node(node_id)
-            if node is None:
-                continue
-            node.set_2d_position(x, y)
-            updated.append(node.to_dict())
-        current_graph.modified = True
-    return updated
-
-
-def create_node(x: float, y: float, text: str = "") -> Dict:
-    with _graph_lock:
+    async with _write_lock:
+        return _move_nodes(positions)
+
+
+async def create_node(x: float, y: float, text: str = "") -> Dict:
+    async with _write_lock:
         node = current_graph.create_node(x=x, y=y, text=text)
+        _touch()
         return node.to_dict()
 
 
-def create_edge(source_id: str, target_id: str, text: str = "") -> Dict:
-    with _graph_lock:
+async def create_edge(source_id: str, target_id: str, text: str = "") -> Dict:
+    async with _write_lock:
         edge = current_graph.create_edge(source_id=source_id, target_id=target_id, text=text)
+        _touch()
         return edge.to_dict()
 
 
-def delete_node(node_id: str) -> bool:
-    with _graph_lock:
-        return current_graph.remove_node(node_id)
+async def delete_node(node_id: str) -> bool:
+    async with _write_lock:
+        removed = current_graph.remove_node(node_id)
+        _touch()
+        return removed
 
 
-def delete_edge(edge_id: str) -> bool:
-    with _graph_lock:
-        return current_graph.remove_edge(edge_id)
+async def delete_edge(edge_id: str) -> bool:
+    async with _write_lock:
+        removed = current_graph.remove_edge(edge_id)
+        _touch()
+        return removed
 
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from graph_canvas.application.dto import (
     EdgeDTO,
@@ -20,6 +20,9 @@ from graph_canvas.domain.exceptions import (
 from graph_canvas.domain.repositories import GraphRepository
 
 
+_POSITION_KEYS = frozenset(("x", "y", "z"))
+
+
 class GraphService:
     """Coordinates operations on the Graph aggregate."""
 
@@ -35,6 +38,18 @@ class GraphService:
         except KeyError as exc:  # pragma: no cover - defensive for custom repos
             raise GraphNotFoundError(str(exc)) from exc
 
+    def list_graph_dicts(self) -> List[Dict[str, Any]]:
+        return self._repository.list_graph_dicts()
+
+    def iter_graph_dicts(self) -> Iterator[Dict[str, Any]]:
+        return self._repository.iter_graph_dicts()
+
+    def get_graph_dict(self, graph_id: str) -> Dict[str, Any]:
+        try:
+            return self._repository.get_graph_dict(graph_id)
+        except KeyError as exc:  # pragma: no cover - defensive for custom repos
+            raise GraphNotFoundError(str(exc)) from exc
+
     def ensure_graph(self, graph_id: str, name: str = "Workspace") -> Graph:
         try:
             return self.get_graph(graph_id)
@@ -43,11 +58,11 @@ class GraphService:
             return self._repository.save_graph(graph)
 
     def create_graph(self, data: GraphCreateDTO) -> Graph:
-        existing = next(
-            (graph for graph in self._repository.list_graphs() if graph.id == data.id),
-            None,
-        )
-        if existing:
+        try:
+            self.get_graph(data.id)
+        except GraphNotFoundError:
+            pass
+        else:
             raise GraphAlreadyExistsError(f"Graph '{data.id}' already exists")
 
         graph = Graph(
@@ -128,7 +143,7 @@ class GraphService:
         updates = payload.copy()
         updates.pop("id", None)
 
-        if {"x", "y", "z"} & updates.keys():
+        if not _POSITION_KEYS.isdisjoint(updates):
             node.set_position(
                 updates.pop("x", node.data.get("x", 0.0)),
                 updates.pop("y", node.data.get("y", 0.0)),
@@ -189,15 +204,22 @@ class GraphService:
             edge.data["metadata"] = metadata
         edge.data.update(updates)
 
+        graph.add_edge(edge)
         self._repository.save_graph(graph)
         return edge
 
     def patch_node_positions(
-        self, graph_id: str, positions: Sequence[Tuple[str, float, float]]
+        self, graph_id: str, positions: Iterable[Tuple[str, float, float]]
     ) -> List[Dict[str, Any]]:
+        """Move nodes and return only those whose position actually changed.
+
+        Unknown ids and no-op moves are left out of the result, and nothing
+        is saved when no node moved.
+        """
         graph = self.ensure_graph(graph_id)
-        updated = graph.patch_node_positions(list(positions))
-        self._repository.save_graph(graph)
+        updated = graph.patch_node_positions(positions)
+        if updated:
+            self._repository.save_graph(graph)
         return updated
 
     def delete_node(self, graph_id: str, node_id: str) -> None:
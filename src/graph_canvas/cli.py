@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
-import typer
-
-app = typer.Typer(help="Graph Canvas launcher")
+if TYPE_CHECKING:
+    import typer
 
 
 def run() -> None:
@@ -15,39 +15,46 @@ def run() -> None:
     if len(sys.argv) <= 1:
         _launch_desktop()
     else:
-        app()
-
-
-@app.command()
-def desktop(debug: bool = typer.Option(False, "--debug", help="Enable wxPython debug logging")):
-    """Launch the wxPython desktop UI explicitly."""
-    _launch_desktop(debug=debug)
-
-
-@app.command()
-def api(
-    host: str = typer.Option("0.0.0.0", help="Host interface to bind"),
-    port: int = typer.Option(8000, help="Port to expose the API"),
-    reload: bool = typer.Option(False, help="Enable uvicorn reload (dev only)"),
-) -> None:
-    """Run the FastAPI backend (required for desktop + web)."""
-    _serve_api(host=host, port=port, reload=reload)
-
-
-@app.command()
-def web(
-    host: str = typer.Option("0.0.0.0", help="Host interface to bind"),
-    port: int = typer.Option(5173, help="Port for the Vite dev server"),
-    api_url: Optional[str] = typer.Option(
-        None,
-        help="Base URL for the Graph Canvas API (defaults to current origin if omitted)",
-    ),
-    skip_install: bool = typer.Option(
-        False, "--skip-install", help="Skip npm install even if node_modules missing"
-    ),
-) -> None:
-    """Run the React/Vite development server."""
-    _launch_web_ui(port=port, host=host, api_url=api_url, install=not skip_install)
+        get_app()()
+
+
+@lru_cache(maxsize=None)
+def get_app() -> "typer.Typer":
+    """Build the Typer application on first use so bare launches skip typer/click."""
+    import typer
+
+    app = typer.Typer(help="Graph Canvas launcher")
+
+    @app.command()
+    def desktop(debug: bool = typer.Option(False, "--debug", help="Enable wxPython debug logging")):
+        """Launch the wxPython desktop UI explicitly."""
+        _launch_desktop(debug=debug)
+
+    @app.command()
+    def api(
+        host: str = typer.Option("0.0.0.0", help="Host interface to bind"),
+        port: int = typer.Option(8000, help="Port to expose the API"),
+        reload: bool = typer.Option(False, help="Enable uvicorn reload (dev only)"),
+    ) -> None:
+        """Run the FastAPI backend (required for desktop + web)."""
+        _serve_api(host=host, port=port, reload=reload)
+
+    @app.command()
+    def web(
+        host: str = typer.Option("0.0.0.0", help="Host interface to bind"),
+        port: int = typer.Option(5173, help="Port for the Vite dev server"),
+        api_url: Optional[str] = typer.Option(
+            None,
+            help="Base URL for the Graph Canvas API (defaults to current origin if omitted)",
+        ),
+        skip_install: bool = typer.Option(
+            False, "--skip-install", help="Skip npm install even if node_modules missing"
+        ),
+    ) -> None:
+        """Run the React/Vite development server."""
+        _launch_web_ui(port=port, host=host, api_url=api_url, install=not skip_install)
+
+    return app
 
 
 def _launch_desktop(debug: bool = False) -> None:
@@ -65,4 +72,4 @@ def _serve_api(host: str, port: int, reload: bool) -> None:
 def _launch_web_ui(host: str, port: int, api_url: Optional[str], install: bool) -> None:
     from .presentation.web.runner import launch_web_ui as _launch_web
 
-    _launch_web(port=port, host=host, api_url=api_url, install=install)
\ No newline at end of file
+    _launch_web(port=port, host=host, api_url=api_url, install=install)
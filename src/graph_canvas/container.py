@@ -10,6 +10,9 @@ from graph_canvas.domain.entities import Edge, Graph, Node
 from graph_canvas.infrastructure.repositories.json_file import (
     JsonGraphRepository,
 )
+from graph_canvas.infrastructure.repositories.write_behind import (
+    WriteBehindGraphRepository,
+)
 
 
 def _project_root() -> Path:
@@ -46,5 +49,5 @@ def get_graph_service() -> GraphService:
     """Provide a shared GraphService instance backed by JSON persistence."""
     data_dir = _project_root() / "data"
     repository = JsonGraphRepository(data_dir / "graphs.json", seed=[_seed_graph()])
-    return GraphService(repository)
+    return GraphService(WriteBehindGraphRepository(repository))
 
@@ -7,9 +7,26 @@ They operate purely on dictionaries so that rich GUI-specific payloads
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Tuple
-from uuid import uuid4
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
+def _max_sequence(ids: Iterable[str], prefix: str) -> int:
+    """Highest hex counter among ids shaped like ``<prefix><hex>``."""
+    highest = 0
+    for item_id in ids:
+        if item_id.startswith(prefix):
+            try:
+                highest = max(highest, int(item_id[len(prefix):], 16))
+            except ValueError:
+                continue
+    return highest
+
+
+# Graph metadata key holding the highest node/edge counters ever issued.
+_ID_SEQUENCE_KEY = "id_sequence"
 
 
 def _tuple_color(value: Iterable[int] | None, default: Tuple[int, int, int]) -> Tuple[int, int, int]:
@@ -32,15 +49,27 @@ GRAPH_TYPE_CHOICES: Tuple[str, ...] = (
 )
 
 
+_GRAPH_TYPE_SET = frozenset(GRAPH_TYPE_CHOICES)
+_EDGE_KEYS = frozenset(("id", "source_id", "target_id"))
+
+
 def normalize_graph_type(value: str | None) -> str:
+    # Stored payloads are already canonical; skip the strip/lower work for them.
+    if value in _GRAPH_TYPE_SET:
+        return sys.intern(value)  # type: ignore[arg-type]
+    return _normalize_graph_type(value)
+
+
+@lru_cache(maxsize=64)
+def _normalize_graph_type(value: str | None) -> str:
     if not value:
         return "graph"
     normalized = value.strip().lower()
-    if normalized not in GRAPH_TYPE_CHOICES:
+    if normalized not in _GRAPH_TYPE_SET:
         raise ValueError(
             f"graph_type '{value}' is invalid. Choose one of: {', '.join(GRAPH_TYPE_CHOICES)}"
         )
-    return normalized
+    return sys.intern(normalized)
 
 
 @dataclass
@@ -52,9 +81,16 @@ class Node:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "Node":
-        payload = payload.copy()
-        node_id = payload.pop("id")
-        return cls(id=node_id, data=payload)
+        return cls._fast_construct(
+            payload["id"], {key: value for key, value in payload.items() if key != "id"}
+        )
+
+    @classmethod
+    def _fast_construct(cls, node_id: str, data: Dict[str, Any]) -> "Node":
+        node = object.__new__(cls)
+        node.id = node_id
+        node.data = data
+        return node
 
     def to_dict(self) -> Dict[str, Any]:
         return {"id": self.id, **self.data}
@@ -81,11 +117,23 @@ class Edge:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "Edge":
-        payload = payload.copy()
-        edge_id = payload.pop("id")
-        source_id = payload.pop("source_id")
-        target_id = payload.pop("target_id")
-        return cls(id=edge_id, source_id=source_id, target_id=target_id, data=payload)
+        return cls._fast_construct(
+            payload["id"],
+            payload["source_id"],
+            payload["target_id"],
+            {key: value for key, value in payload.items() if key not in _EDGE_KEYS},
+        )
+
+    @classmethod
+    def _fast_construct(
+        cls, edge_id: str, source_id: str, target_id: str, data: Dict[str, Any]
+    ) -> "Edge":
+        edge = object.__new__(cls)
+        edge.id = edge_id
+        edge.source_id = source_id
+        edge.target_id = target_id
+        edge.data = data
+        return edge
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -112,10 +160,17 @@ class Graph:
     grid_size: int = 20
     grid_color: Tuple[int, int, int] = (240, 240, 240)
     grid_line_thickness: float = 1.0
+    _adjacency: Dict[str, Set[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _node_seq: int | None = field(default=None, init=False, repr=False, compare=False)
+    _edge_seq: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.graph_type = normalize_graph_type(self.graph_type)
         self.directed = bool(self.directed)
+        for edge in self.edges.values():
+            self._index_edge(edge)
 
     def add_node(self, node: Node) -> None:
         self.nodes[node.id] = node
@@ -143,14 +198,16 @@ class Graph:
         payload.setdefault("metadata", {})
 
         node = Node(
-            id=str(uuid4()),
+            id=self._next_node_id(),
             data=payload,
         )
         self.add_node(node)
         return node
 
     def add_edge(self, edge: Edge) -> None:
+        """Insert or re-register an edge (call again after changing its endpoints)."""
         self.edges[edge.id] = edge
+        self._index_edge(edge)
 
     def create_edge(
         self,
@@ -172,7 +229,7 @@ class Graph:
         payload.setdefault("metadata", {})
 
         edge = Edge(
-            id=str(uuid4()),
+            id=self._next_edge_id(),
             source_id=source_id,
             target_id=target_id,
             data=payload,
@@ -188,44 +245,104 @@ class Graph:
 
     def remove_node(self, node_id: str) -> None:
         self.nodes.pop(node_id, None)
-        self.edges = {
-            edge_id: edge
-            for edge_id, edge in self.edges.items()
-            if node_id not in {edge.source_id, edge.target_id}
-        }
+        for edge_id in self._adjacency.pop(node_id, ()):
+            edge = self.edges.get(edge_id)
+            # Entries can be stale if an edge was rewired; only drop real incidences.
+            if edge is not None and node_id in (edge.source_id, edge.target_id):
+                self.remove_edge(edge_id)
 
     def remove_edge(self, edge_id: str) -> None:
-        self.edges.pop(edge_id, None)
-
-    def patch_node_positions(self, positions: List[Tuple[str, float, float]]) -> List[Dict[str, Any]]:
-        updated = []
+        edge = self.edges.pop(edge_id, None)
+        if edge is None:
+            return
+        for node_id in (edge.source_id, edge.target_id):
+            incident = self._adjacency.get(node_id)
+            if incident is not None:
+                incident.discard(edge_id)
+
+    def _next_node_id(self) -> str:
+        if self._node_seq is None:
+            self._node_seq = max(_max_sequence(self.nodes, "n"), self._stored_sequence("node"))
+        while True:
+            self._node_seq += 1
+            node_id = f"n{self._node_seq:x}"
+            if node_id not in self.nodes:
+                self._store_sequence("node", self._node_seq)
+                return node_id
+
+    def _next_edge_id(self) -> str:
+        if self._edge_seq is None:
+            self._edge_seq = max(_max_sequence(self.edges, "e"), self._stored_sequence("edge"))
+        while True:
+            self._edge_seq += 1
+            edge_id = f"e{self._edge_seq:x}"
+            if edge_id not in self.edges:
+                self._store_sequence("edge", self._edge_seq)
+                return edge_id
+
+    def _stored_sequence(self, kind: str) -> int:
+        stored = self.metadata.get(_ID_SEQUENCE_KEY)
+        return int(stored.get(kind, 0)) if isinstance(stored, dict) else 0
+
+    def _store_sequence(self, kind: str, value: int) -> None:
+        # Persisted with the graph so ids of deleted items are not reissued after a reload.
+        stored = self.metadata.get(_ID_SEQUENCE_KEY)
+        if not isinstance(stored, dict):
+            stored = self.metadata[_ID_SEQUENCE_KEY] = {}
+        stored[kind] = value
+
+    def _index_edge(self, edge: Edge) -> None:
+        self._adjacency.setdefault(edge.source_id, set()).add(edge.id)
+        self._adjacency.setdefault(edge.target_id, set()).add(edge.id)
+
+    def patch_node_positions(
+        self, positions: Iterable[Tuple[str, float, float]]
+    ) -> List[Dict[str, Any]]:
+        """Move nodes, returning each node whose position changed exactly once."""
+        nodes = self.nodes
+        changed: Dict[str, Node] = {}
         for node_id, x, y in positions:
-            node = self.nodes.get(node_id)
-            if not node:
+            node = nodes.get(node_id)
+            if node is None:
+                continue
+            data = node.data
+            if data.get("x") == x and data.get("y") == y:
                 continue
-            node.set_position(x, y)
-            updated.append(node.to_dict())
-        return updated
+            data["x"] = x
+            data["y"] = y
+            changed[node_id] = node
+        return [node.to_dict() for node in changed.values()]
 
     def to_dict(self) -> Dict[str, Any]:
+        # Node/Edge.to_dict are inlined to skip a method call per item.
         return {
             "id": self.id,
             "name": self.name,
             "graph_type": self.graph_type,
             "directed": self.directed,
             "metadata": self.metadata,
-            "nodes": [node.to_dict() for node in self.nodes.values()],
-            "edges": [edge.to_dict() for edge in self.edges.values()],
-            "background_color": list(self.background_color),
+            "nodes": [{"id": node.id, **node.data} for node in self.nodes.values()],
+            "edges": [
+                {
+                    "id": edge.id,
+                    "source_id": edge.source_id,
+                    "target_id": edge.target_id,
+                    **edge.data,
+                }
+                for edge in self.edges.values()
+            ],
+            "background_color": self.background_color,
             "grid_visible": self.grid_visible,
             "grid_size": self.grid_size,
-            "grid_color": list(self.grid_color),
+            "grid_color": self.grid_color,
             "grid_line_thickness": self.grid_line_thickness,
         }
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "Graph":
-        graph = cls(
+        nodes = {item["id"]: Node.from_dict(item) for item in payload.get("nodes", [])}
+        edges = {item["id"]: Edge.from_dict(item) for item in payload.get("edges", [])}
+        return cls(
             id=payload["id"],
             name=payload.get("name", payload["id"]),
             graph_type=payload.get("graph_type", "graph"),
@@ -236,12 +353,7 @@ class Graph:
             grid_size=payload.get("grid_size", 20),
             grid_color=_tuple_color(payload.get("grid_color"), (240, 240, 240)),
             grid_line_thickness=payload.get("grid_line_thickness", 1.0),
+            nodes=nodes,
+            edges=edges,
         )
-        for node_data in payload.get("nodes", []):
-            node = Node.from_dict(node_data)
-            graph.add_node(node)
-        for edge_data in payload.get("edges", []):
-            edge = Edge.from_dict(edge_data)
-            graph.add_edge(edge)
-        return graph
 
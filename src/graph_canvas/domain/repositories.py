@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, Dict, Iterable, Iterator, List
 
 from graph_canvas.domain.entities import Graph
 
@@ -27,4 +27,15 @@ class GraphRepository(ABC):
     def delete_graph(self, graph_id: str) -> None:
         ...
 
+    def list_graph_dicts(self) -> List[Dict[str, Any]]:
+        """Serialized graphs; override when the store can skip building entities."""
+        return [graph.to_dict() for graph in self.list_graphs()]
+
+    def iter_graph_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield serialized graphs one at a time for streaming responses."""
+        return iter(self.list_graph_dicts())
+
+    def get_graph_dict(self, graph_id: str) -> Dict[str, Any]:
+        return self.get_graph(graph_id).to_dict()
+
 
@@ -2,65 +2,295 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import mmap
+import os
 import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, one process per file
+    fcntl = None
 
 from graph_canvas.domain.entities import Graph
 from graph_canvas.domain.exceptions import GraphNotFoundError
 from graph_canvas.domain.repositories import GraphRepository
+from graph_canvas.infrastructure.serialization import orjson_default
 
 
 class JsonGraphRepository(GraphRepository):
-    """Stores graph aggregates inside a single JSON file."""
+    """Stores graph aggregates inside a single JSON file.
+
+    Mutations are appended to an NDJSON journal next to the file
+    (``{"op": "put"|"del", ...}`` per line) and folded back into the
+    canonical JSON file by a periodic compaction and at interpreter exit.
+    On startup the canonical file is loaded and the journal replayed.
+
+    Several processes may share one file: appends, replays and the
+    journal reset hold an exclusive ``flock`` on the journal, and
+    compactions are serialized through a ``.lock`` file next to it.
+    """
 
-    def __init__(self, path: str | Path, seed: Iterable[Graph] | None = None):
+    def __init__(
+        self,
+        path: str | Path,
+        seed: Iterable[Graph] | None = None,
+        compact_interval: float = 5.0,
+        durable: bool = False,
+    ):
         self._path = Path(path)
+        self._journal_path = self._path.with_suffix(".ndjson")
         self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._compact_interval = compact_interval
+        self._durable = durable
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
-        if not self._path.exists():
-            payload = [graph.to_dict() for graph in (seed or [])]
-            self._write(payload)
+        # graph id -> encoded graph; decoding on read hands out independent copies.
+        # Copy-on-write: writers swap in a new dict, so readers never lock.
+        self._index: Dict[str, bytes] = {}
+        # (inode, mtime) of the canonical file the index was loaded from.
+        self._file_key: Optional[tuple] = None
+        # Bytes of the journal already folded into ``_index``.
+        self._journal_offset = 0
+
+        self._journal = os.open(
+            self._journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        self._compact_fd = os.open(
+            self._path.with_name(self._path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o644
+        )
+        with self._locked():
+            if self._path.exists():
+                self._index = self._load()
+            else:
+                for graph in seed or []:
+                    self._index[graph.id] = self._encode(graph.to_dict())
+                self._dirty = True
+            if self._replay_journal(self._index):
+                self._dirty = True
+        self._compact()
+        atexit.register(self._compact)
+
+    def close(self) -> None:
+        """Fold the journal into the file and release the file handles."""
+        atexit.unregister(self._compact)
+        self._compact()
+        os.close(self._journal)
+        os.close(self._compact_fd)
 
     def list_graphs(self) -> Iterable[Graph]:
-        return [Graph.from_dict(item) for item in self._read()]
+        return [Graph.from_dict(orjson.loads(blob)) for blob in self._blobs()]
 
     def get_graph(self, graph_id: str) -> Graph:
-        for payload in self._read():
-            if payload.get("id") == graph_id:
-                return Graph.from_dict(payload)
-        raise GraphNotFoundError(f"Graph '{graph_id}' not found")
+        return Graph.from_dict(orjson.loads(self._blob(graph_id)))
+
+    def list_graph_dicts(self) -> List[Dict[str, Any]]:
+        return [orjson.loads(blob) for blob in self._blobs()]
+
+    def iter_graph_dicts(self) -> Iterator[Dict[str, Any]]:
+        for blob in self._blobs():
+            yield orjson.loads(blob)
+
+    def get_graph_dict(self, graph_id: str) -> Dict[str, Any]:
+        return orjson.loads(self._blob(graph_id))
 
     def save_graph(self, graph: Graph) -> Graph:
-        data = self._read()
-        updated = False
-        for idx, payload in enumerate(data):
-            if payload.get("id") == graph.id:
-                data[idx] = graph.to_dict()
-                updated = True
-                break
-        if not updated:
-            data.append(graph.to_dict())
-        self._write(data)
+        blob = self._encode(graph.to_dict())
+        with self._locked():
+            self._refresh_locked()
+            index = dict(self._index)
+            index[graph.id] = blob
+            self._index = index
+            self._append(b'{"op":"put","graph":' + blob + b"}\n")
         return graph
 
     def delete_graph(self, graph_id: str) -> None:
-        data = self._read()
-        new_data = [payload for payload in data if payload.get("id") != graph_id]
-        if len(new_data) == len(data):
+        with self._locked():
+            self._refresh_locked()
+            if graph_id not in self._index:
+                raise GraphNotFoundError(f"Graph '{graph_id}' not found")
+            index = dict(self._index)
+            del index[graph_id]
+            self._index = index
+            self._append(orjson.dumps({"op": "del", "id": graph_id}) + b"\n")
+
+    def _blobs(self) -> List[bytes]:
+        self._refresh()
+        return list(self._index.values())
+
+    def _blob(self, graph_id: str) -> bytes:
+        self._refresh()
+        blob = self._index.get(graph_id)
+        if blob is None:
             raise GraphNotFoundError(f"Graph '{graph_id}' not found")
-        self._write(new_data)
+        return blob
 
-    def _read(self) -> List[dict]:
+    @staticmethod
+    def _encode(payload: dict) -> bytes:
+        return orjson.dumps(payload, default=orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the thread lock and the journal's inter-process lock."""
         with self._lock:
-            if not self._path.exists():
+            _flock(self._journal, True)
+            try:
+                yield
+            finally:
+                _flock(self._journal, False)
+
+    def _append(self, line: bytes) -> None:
+        if os.fstat(self._journal).st_size != self._journal_offset:
+            line = b"\n" + line  # isolate a torn tail left by a crashed writer
+        os.write(self._journal, line)
+        if self._durable:
+            os.fsync(self._journal)
+        self._journal_offset = os.fstat(self._journal).st_size
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self._compact_interval, self._compact)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _load(self) -> Dict[str, bytes]:
+        self._file_key = self._stat_key()
+        self._journal_offset = 0
+        return {payload["id"]: self._encode(payload) for payload in self._read()}
+
+    def _stat_key(self) -> tuple:
+        stat = self._path.stat()
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _is_stale(self) -> bool:
+        try:
+            return self._stat_key() != self._file_key
+        except FileNotFoundError:
+            return False
+
+    def _refresh(self) -> None:
+        """Catch up if another process replaced the file or appended to the journal."""
+        if self._is_stale() or os.fstat(self._journal).st_size != self._journal_offset:
+            with self._locked():
+                self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        """Catch up with the file and with journal entries written by other processes."""
+        index = None
+        if self._is_stale() or os.fstat(self._journal).st_size < self._journal_offset:
+            index = self._load()
+        if os.fstat(self._journal).st_size != self._journal_offset:
+            if index is None:
+                index = dict(self._index)
+            self._replay_journal(index)
+        if index is not None:
+            self._index = index
+
+    def _replay_journal(self, index: Dict[str, bytes]) -> bool:
+        """Apply journal entries past ``_journal_offset`` to ``index``."""
+        replayed = False
+        with self._journal_path.open("rb") as handle:
+            handle.seek(self._journal_offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break  # torn tail from an interrupted append
+                self._journal_offset += len(line)
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                replayed = True
+                if entry.get("op") == "put":
+                    graph = entry["graph"]
+                    index[graph["id"]] = self._encode(graph)
+                elif entry.get("op") == "del":
+                    index.pop(entry["id"], None)
+        return replayed
+
+    def _compact(self) -> None:
+        """Rewrite the canonical file from memory and reset the journal.
+
+        Only the snapshot is taken under the lock; the file is written
+        without it, so saves keep appending while a compaction runs.
+        """
+        with self._compact_lock:
+            _flock(self._compact_fd, True)
+            try:
+                self._compact_exclusive()
+            finally:
+                _flock(self._compact_fd, False)
+
+    def _compact_exclusive(self) -> None:
+        with self._locked():
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            # Fold in whatever other processes wrote, or their entries are lost below.
+            self._refresh_locked()
+            if not self._dirty:
+                return
+            blobs = list(self._index.values())
+            offset = self._journal_offset
+            self._dirty = False
+        try:
+            self._write([orjson.loads(blob) for blob in blobs])
+        except BaseException:
+            self._dirty = True
+            raise
+        with self._locked():
+            self._file_key = self._stat_key()
+            # Keep entries appended after the snapshot; they are not in the file yet.
+            with self._journal_path.open("rb") as handle:
+                handle.seek(offset)
+                tail = handle.read()
+            os.ftruncate(self._journal, 0)
+            if tail:
+                os.write(self._journal, tail)
+            self._journal_offset -= offset
+
+    def _read(self) -> List[dict]:
+        # Parse straight from the page cache instead of copying into bytes first.
+        with self._path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
                 return []
-            return json.loads(self._path.read_text() or "[]")
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
 
     def _write(self, payload: List[dict]) -> None:
-        with self._lock:
-            self._path.write_text(json.dumps(payload, indent=2))
+        data = orjson.dumps(
+            payload,
+            default=orjson_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY,
+        )
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        # Write the whole file in one go, then swap it in atomically.
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, self._path)
+        if self._durable and hasattr(os, "O_DIRECTORY"):
+            # Persist the rename itself, not just the file contents.
+            dir_fd = os.open(self._path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
 
+def _flock(fd: int, exclusive: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_UN)
@@ -0,0 +1,119 @@
+"""Repository decorator that coalesces bursts of saves into delayed writes."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from graph_canvas.domain.entities import Graph
+from graph_canvas.domain.exceptions import GraphNotFoundError
+from graph_canvas.domain.repositories import GraphRepository
+
+
+class WriteBehindGraphRepository(GraphRepository):
+    """Keeps recently saved graphs in memory and persists them after a short delay.
+
+    Interactive edits (e.g. streaming node positions during a drag) save the
+    same graph many times per second; only the latest state within each
+    ``delay`` window reaches the wrapped repository.
+
+    Reads hand out copies of pending graphs, like the wrapped repositories
+    do, so callers never mutate an object a flush may be serializing.
+    """
+
+    def __init__(self, inner: GraphRepository, delay: float = 0.2):
+        self._inner = inner
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # graph id -> (graph, generation); the generation detects re-saves mid-flush.
+        self._pending: Dict[str, Tuple[Graph, int]] = {}
+        self._generation = 0
+        self._timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+
+    def list_graphs(self) -> Iterable[Graph]:
+        with self._lock:
+            pending = {graph_id: graph for graph_id, (graph, _) in self._pending.items()}
+        graphs: List[Graph] = []
+        for graph in self._inner.list_graphs():
+            entry = pending.pop(graph.id, None)
+            graphs.append(graph if entry is None else _copy(entry))
+        graphs.extend(_copy(graph) for graph in pending.values())
+        return graphs
+
+    def get_graph(self, graph_id: str) -> Graph:
+        with self._lock:
+            entry = self._pending.get(graph_id)
+        if entry is not None:
+            return _copy(entry[0])
+        return self._inner.get_graph(graph_id)
+
+    def list_graph_dicts(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            pending = {graph_id: graph for graph_id, (graph, _) in self._pending.items()}
+        payloads: List[Dict[str, Any]] = []
+        for payload in self._inner.list_graph_dicts():
+            graph = pending.pop(payload["id"], None)
+            payloads.append(payload if graph is None else graph.to_dict())
+        payloads.extend(graph.to_dict() for graph in pending.values())
+        return payloads
+
+    def get_graph_dict(self, graph_id: str) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._pending.get(graph_id)
+        if entry is not None:
+            return entry[0].to_dict()
+        return self._inner.get_graph_dict(graph_id)
+
+    def save_graph(self, graph: Graph) -> Graph:
+        with self._lock:
+            self._generation += 1
+            self._pending[graph.id] = (graph, self._generation)
+            if self._timer is None:
+                self._schedule()
+        return graph
+
+    def delete_graph(self, graph_id: str) -> None:
+        # Wait out an in-flight flush so it cannot write the graph back afterwards.
+        with self._flush_lock:
+            with self._lock:
+                was_pending = self._pending.pop(graph_id, None) is not None
+            try:
+                self._inner.delete_graph(graph_id)
+            except GraphNotFoundError:
+                if not was_pending:
+                    raise
+
+    def flush(self) -> None:
+        """Write every pending graph to the wrapped repository now."""
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                batch = list(self._pending.items())
+            for graph_id, (graph, generation) in batch:
+                try:
+                    self._inner.save_graph(graph)
+                except RuntimeError:
+                    # The graph was mutated while being serialized; it was
+                    # re-saved as well, so the next flush picks it up.
+                    continue
+                with self._lock:
+                    entry = self._pending.get(graph_id)
+                    if entry is not None and entry[1] == generation:
+                        del self._pending[graph_id]
+            with self._lock:
+                if self._pending and self._timer is None:
+                    self._schedule()
+
+    def _schedule(self) -> None:
+        self._timer = threading.Timer(self._delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+
+def _copy(graph: Graph) -> Graph:
+    return Graph.from_dict(graph.to_dict())
@@ -0,0 +1,12 @@
+"""Shared orjson helpers for persisting and serving graph payloads."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def orjson_default(obj: Any) -> Any:
+    """Fallback for types orjson does not encode natively (tuples already are)."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
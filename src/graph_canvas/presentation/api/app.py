@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from fastapi import Body, FastAPI, HTTPException, Request, status
+import msgspec
+import orjson
+from fastapi import Body, Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, ValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
 
 from graph_canvas.application.dto import (
     EdgeDTO,
@@ -22,6 +25,7 @@ from graph_canvas.domain.exceptions import (
     GraphNotFoundError,
     NodeNotFoundError,
 )
+from graph_canvas.infrastructure.serialization import orjson_default
 from graph_canvas.presentation.api.schemas import (
     EdgeCreateSchema,
     EdgeSchema,
@@ -36,28 +40,35 @@ from graph_canvas.presentation.api.schemas import (
 
 DEFAULT_GRAPH_ID = "workspace"
 DEFAULT_GRAPH_NAME = "Workspace"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
 
 
-class GraphPayload(BaseModel):
+class GraphPayload(msgspec.Struct, omit_defaults=True):
+    """Whole-graph compat payload; nodes/edges stay plain dicts, so msgspec decodes it in one pass."""
+
     id: Optional[str] = None
     name: Optional[str] = None
     graph_type: Optional[str] = None
     directed: Optional[bool] = None
     metadata: Optional[Dict[str, Any]] = None
-    nodes: List[Dict[str, Any]] = Field(default_factory=list)
-    edges: List[Dict[str, Any]] = Field(default_factory=list)
+    nodes: List[Dict[str, Any]] = []
+    edges: List[Dict[str, Any]] = []
     background_color: Optional[List[int]] = None
     grid_visible: Optional[bool] = None
     grid_size: Optional[int] = None
     grid_color: Optional[List[int]] = None
 
 
-class NodePosition(BaseModel):
+class NodePosition(msgspec.Struct):
     id: str
     x: float
     y: float
 
 
+class NodePositions(msgspec.Struct):
+    positions: List[NodePosition]
+
+
 class NewNode(BaseModel):
     x: float
     y: float
@@ -70,29 +81,100 @@ class NewEdge(BaseModel):
     text: Optional[str] = ""
 
 
-def _schema_payload(schema: BaseModel, exclude: Optional[set[str]] = None) -> Dict[str, Any]:
-    data = schema.model_dump(exclude_none=True)
-    for field in exclude or set():
-        data.pop(field, None)
+def _schema_payload(schema: BaseModel, exclude: frozenset[str] = frozenset()) -> Dict[str, Any]:
+    """Top-level non-None fields plus extras, read directly instead of via model_dump."""
+    data = {
+        name: value
+        for name in type(schema).model_fields
+        if name not in exclude and (value := getattr(schema, name)) is not None
+    }
+    if schema.model_extra:
+        data.update(
+            (name, value)
+            for name, value in schema.model_extra.items()
+            if name not in exclude and value is not None
+        )
     return data
 
 
-def _parse_positions(payload: Any) -> List[NodePosition]:
+_NODE_KEYS = frozenset(("id",))
+_EDGE_KEYS = frozenset(("id", "source_id", "target_id"))
+_NEW_NODE_KEYS = frozenset(("x", "y", "text"))
+_NEW_EDGE_KEYS = frozenset(("source_id", "target_id", "text"))
+
+
+# Decoders are built once per type so each request reuses the compiled schema.
+_GRAPH_DECODER = msgspec.json.Decoder(GraphPayload)
+_POSITIONS_DECODER = msgspec.json.Decoder(Union[List[NodePosition], NodePositions])
+# Compact binary form of the hot drag endpoint: a msgpack array of [id, x, y] arrays.
+_POSITIONS_MSGPACK_DECODER = msgspec.msgpack.Decoder(List[Tuple[str, float, float]])
+
+# Bodies decoded by hand are invisible to FastAPI, so document them from the same types.
+(_GRAPH_BODY_SCHEMA, _POSITIONS_BODY_SCHEMA, _POSITIONS_MSGPACK_BODY_SCHEMA), _BODY_COMPONENTS = (
+    msgspec.json.schema_components(
+        (GraphPayload, Union[List[NodePosition], NodePositions], List[Tuple[str, float, float]]),
+        ref_template="#/components/schemas/{name}",
+    )
+)
+_GRAPH_SNAPSHOT_BODY_SCHEMA = {"$ref": "#/components/schemas/GraphResponseSchema"}
+
+
+def _request_body(content: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """``openapi_extra`` documenting a required body per media type."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {media_type: {"schema": schema} for media_type, schema in content.items()},
+        }
+    }
+
+
+_POSITIONS_REQUEST_BODY = _request_body(
+    {
+        "application/json": _POSITIONS_BODY_SCHEMA,
+        MSGPACK_MEDIA_TYPE: _POSITIONS_MSGPACK_BODY_SCHEMA,
+    }
+)
+
+
+async def _decode(request: Request, decoder: Union[msgspec.json.Decoder, msgspec.msgpack.Decoder]):
     try:
-        if isinstance(payload, list):
-            items = payload
-        elif isinstance(payload, dict) and "positions" in payload:
-            items = payload["positions"]
-        else:
-            raise ValueError("Expected a list of positions or an object with 'positions'")
-        return [NodePosition.model_validate(item) for item in items]
-    except (ValidationError, ValueError) as exc:
+        return decoder.decode(await request.body())
+    except msgspec.DecodeError as exc:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc)) from exc
 
 
+async def _read_body(request: Request) -> bytes:
+    """Dependency that reads the raw body on the event loop for a sync endpoint to decode."""
+    return await request.body()
+
+
+async def _parse_positions(request: Request) -> Iterator[Tuple[str, float, float]]:
+    """Decode a bare list of positions or ``{"positions": [...]}`` straight from the body.
+
+    Used as a dependency: the body is read and decoded on the event loop, and the
+    (sync) endpoint then applies the lazily yielded (id, x, y) triples in the threadpool.
+    ``application/msgpack`` bodies carry the triples directly.
+    """
+    if request.headers.get("content-type", "").startswith(MSGPACK_MEDIA_TYPE):
+        return iter(await _decode(request, _POSITIONS_MSGPACK_DECODER))
+    payload = await _decode(request, _POSITIONS_DECODER)
+    items = payload.positions if isinstance(payload, NodePositions) else payload
+    return ((item.id, item.x, item.y) for item in items)
+
+
 def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
     service = graph_service or get_graph_service()
-    app = FastAPI(title="Graph Canvas API", version="1.0.0")
+    # Bound once here so the hottest endpoints skip the attribute lookup per request.
+    list_graph_dicts = service.list_graph_dicts
+    iter_graph_dicts = service.iter_graph_dicts
+    get_graph_dict = service.get_graph_dict
+    patch_node_positions = service.patch_node_positions
+    app = FastAPI(
+        title="Graph Canvas API",
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -105,19 +187,38 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
     def health() -> dict[str, str]:
         return {"status": "ok"}
 
-    @app.get("/graphs", response_model=list[GraphResponseSchema], tags=["graphs"])
+    # Read endpoints return stored data as-is: ORJSONResponse skips both response
+    # validation and jsonable_encoder, while `responses` keeps the OpenAPI schema.
+    @app.get(
+        "/graphs",
+        response_model=None,
+        responses={200: {"model": list[GraphResponseSchema]}},
+        tags=["graphs"],
+    )
     def list_graphs():
-        graphs = service.list_graphs()
-        return [graph.to_dict() for graph in graphs]
+        return ORJSONResponse(list_graph_dicts())
+
+    @app.get("/graphs.ndjson", tags=["graphs"])
+    def stream_graphs():
+        """One graph per line, encoded as it is sent."""
+
+        def lines() -> Iterator[bytes]:
+            for payload in iter_graph_dicts():
+                yield orjson.dumps(
+                    payload, default=orjson_default, option=orjson.OPT_APPEND_NEWLINE
+                )
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
 
     @app.get(
         "/graphs/{graph_id}",
-        response_model=GraphResponseSchema,
+        response_model=None,
+        responses={200: {"model": GraphResponseSchema}},
         tags=["graphs"],
     )
     def get_graph(graph_id: str):
         try:
-            return service.get_graph(graph_id).to_dict()
+            return ORJSONResponse(get_graph_dict(graph_id))
         except GraphNotFoundError as exc:
             raise HTTPException(status.HTTP_404_NOT_FOUND, str(exc)) from exc
 
@@ -141,7 +242,7 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
                 grid_color=payload.grid_color,
                 grid_line_thickness=payload.grid_line_thickness,
                 nodes=[
-                    NodeDTO(id=node.id, payload=_schema_payload(node, {"id"}))
+                    NodeDTO(id=node.id, payload=_schema_payload(node, _NODE_KEYS))
                     for node in payload.nodes
                 ],
                 edges=[
@@ -149,7 +250,7 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
                         id=edge.id,
                         source_id=edge.source_id,
                         target_id=edge.target_id,
-                        payload=_schema_payload(edge, {"id", "source_id", "target_id"}),
+                        payload=_schema_payload(edge, _EDGE_KEYS),
                     )
                     for edge in payload.edges
                 ],
@@ -202,6 +303,27 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
         except GraphNotFoundError as exc:
             raise HTTPException(status.HTTP_404_NOT_FOUND, str(exc)) from exc
 
+    @app.put(
+        "/graphs/{graph_id}/snapshot:raw",
+        tags=["graphs"],
+        openapi_extra=_request_body({"application/json": _GRAPH_SNAPSHOT_BODY_SCHEMA}),
+    )
+    def replace_graph_snapshot_raw(graph_id: str, body: bytes = Depends(_read_body)):
+        """Like PUT /snapshot, but skips building and dumping a pydantic model.
+
+        The body is still read into memory whole; only its decoding and the
+        save run in the threadpool, off the event loop.
+        """
+        try:
+            data = orjson.loads(body)
+            if not isinstance(data, dict):
+                raise ValueError("Expected a graph object")
+            data["id"] = graph_id
+            graph = service.replace_graph(data)
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc)) from exc
+        return ORJSONResponse(graph.to_dict())
+
     @app.delete(
         "/graphs/{graph_id}",
         status_code=status.HTTP_204_NO_CONTENT,
@@ -221,27 +343,26 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
         tags=["nodes"],
     )
     def create_node(graph_id: str, payload: NodeCreateSchema):
-        body = _schema_payload(payload)
         node = service.create_node(
             graph_id,
-            x=body.pop("x", 0.0),
-            y=body.pop("y", 0.0),
-            text=body.pop("text", "") or "",
-            data=body,
+            x=payload.x,
+            y=payload.y,
+            text=payload.text or "",
+            data=_schema_payload(payload, _NEW_NODE_KEYS),
         )
         return node.to_dict()
 
     @app.patch(
         "/graphs/{graph_id}/nodes/positions",
         tags=["nodes"],
+        openapi_extra=_POSITIONS_REQUEST_BODY,
     )
-    async def update_node_positions(graph_id: str, request: Request):
+    def update_node_positions(
+        graph_id: str,
+        positions: Iterator[Tuple[str, float, float]] = Depends(_parse_positions),
+    ):
         try:
-            payload = await request.json()
-            parsed = _parse_positions(payload)
-            updated = service.patch_node_positions(
-                graph_id, [(p.id, p.x, p.y) for p in parsed]
-            )
+            updated = patch_node_positions(graph_id, positions)
             return {"updated": updated}
         except GraphNotFoundError as exc:
             raise HTTPException(status.HTTP_404_NOT_FOUND, str(exc)) from exc
@@ -277,14 +398,13 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
         tags=["edges"],
     )
     def create_edge(graph_id: str, payload: EdgeCreateSchema):
-        body = _schema_payload(payload)
         try:
             edge = service.create_edge(
                 graph_id,
-                source_id=body.pop("source_id"),
-                target_id=body.pop("target_id"),
-                text=body.pop("text", "") or "",
-                data=body,
+                source_id=payload.source_id,
+                target_id=payload.target_id,
+                text=payload.text or "",
+                data=_schema_payload(payload, _NEW_EDGE_KEYS),
             )
             return edge.to_dict()
         except GraphNotFoundError as exc:
@@ -316,11 +436,18 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
     # Compatibility endpoints for the wx backend client
     @app.get("/graph", tags=["compat"])
     def compat_get_graph():
-        return service.ensure_graph(DEFAULT_GRAPH_ID, DEFAULT_GRAPH_NAME).to_dict()
+        return ORJSONResponse(service.ensure_graph(DEFAULT_GRAPH_ID, DEFAULT_GRAPH_NAME).to_dict())
 
-    @app.post("/graph", tags=["compat"])
-    def compat_set_graph(payload: GraphPayload):
-        graph_dict = payload.model_dump(exclude_none=True)
+    @app.post(
+        "/graph",
+        tags=["compat"],
+        openapi_extra=_request_body({"application/json": _GRAPH_BODY_SCHEMA}),
+    )
+    def compat_set_graph(body: bytes = Depends(_read_body)):
+        try:
+            graph_dict = msgspec.to_builtins(_GRAPH_DECODER.decode(body))
+        except msgspec.DecodeError as exc:
+            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc)) from exc
         graph_dict.setdefault("id", DEFAULT_GRAPH_ID)
         graph_dict.setdefault("name", graph_dict.get("id", DEFAULT_GRAPH_NAME))
         graph_dict.setdefault("graph_type", graph_dict.get("graph_type", "graph"))
@@ -331,13 +458,11 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
             raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, str(exc)) from exc
         return {"ok": True}
 
-    @app.patch("/nodes/positions", tags=["compat"])
-    async def compat_patch_positions(request: Request):
-        payload = await request.json()
-        parsed = _parse_positions(payload)
-        updated = service.patch_node_positions(
-            DEFAULT_GRAPH_ID, [(p.id, p.x, p.y) for p in parsed]
-        )
+    @app.patch("/nodes/positions", tags=["compat"], openapi_extra=_POSITIONS_REQUEST_BODY)
+    def compat_patch_positions(
+        positions: Iterator[Tuple[str, float, float]] = Depends(_parse_positions),
+    ):
+        updated = patch_node_positions(DEFAULT_GRAPH_ID, positions)
         return {"updated": updated}
 
     @app.post("/nodes", tags=["compat"])
@@ -376,5 +501,14 @@ def create_api_app(graph_service: Optional[GraphService] = None) -> FastAPI:
             raise HTTPException(status.HTTP_404_NOT_FOUND, str(exc)) from exc
         return {"ok": True}
 
+    openapi = app.openapi
+
+    def openapi_with_body_components() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            components = openapi().setdefault("components", {})
+            components.setdefault("schemas", {}).update(_BODY_COMPONENTS)
+        return app.openapi_schema
+
+    app.openapi = openapi_with_body_components
     return app
 
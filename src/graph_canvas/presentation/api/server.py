@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
+
 import uvicorn
 
 from graph_canvas.presentation.api.app import create_api_app
 
 
+def _loop_and_http() -> tuple[str, str]:
+    """Prefer uvloop/httptools when installed (uvicorn[standard]), else uvicorn's defaults."""
+    loop = "uvloop" if find_spec("uvloop") is not None else "auto"
+    http = "httptools" if find_spec("httptools") is not None else "auto"
+    return loop, http
+
+
 def serve(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) -> None:
     """Start the API server."""
+    loop, http = _loop_and_http()
     uvicorn.run(
         create_api_app(),
         host=host,
         port=port,
         reload=reload,
+        loop=loop,
+        http=http,
         log_level="info",
     )
-
-
@@ -394,6 +394,7 @@ def on_graph_type_changed(main_window: "m_main_window.MainWindow", event):
                 # Keep is_hyperedge only if multiple endpoints remain
                 if len(getattr(edge, 'source_ids', []) or []) <= 1 and len(getattr(edge, 'target_ids', []) or []) <= 1:
                     edge.is_hyperedge = False
+        main_window.current_graph.invalidate_adjacency()
         # Refresh view
         if hasattr(main_window, 'canvas'):
             main_window.canvas.Refresh()
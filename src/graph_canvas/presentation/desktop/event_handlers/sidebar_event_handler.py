@@ -49,6 +49,10 @@ def on_expand_all_sections(main_window: "m_main_window.MainWindow", event):
         if not pane.IsExpanded():
             pane.Expand()
 
+    # Expand() does not emit EVT_COLLAPSIBLEPANE_CHANGED; catch up on skipped rebuilds
+    if getattr(main_window, '_dep_list_dirty', False):
+        main_window.update_dependency_list_panel()
+
     # Force layout update
     main_window.sidebar.FitInside()
     main_window.Layout()
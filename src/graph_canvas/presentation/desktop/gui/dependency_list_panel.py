@@ -4,14 +4,15 @@ Dependency list sidebar panel shared with the desktop UI.
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from types import SimpleNamespace
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 
 import wx
 
 from graph_canvas.presentation.desktop.models.graph import Graph
 from graph_canvas.presentation.desktop.models.node import Node
-from graph_canvas.presentation.desktop.models.edge import Edge
 
 if TYPE_CHECKING:
     from graph_canvas.presentation.desktop.gui.main_window import MainWindow
@@ -24,6 +25,33 @@ TASK_STATUS_OPTIONS: Sequence[Tuple[Optional[str], str]] = (
     ("blocked", "Blocked"),
     ("complete", "Complete"),
 )
+_STATUS_LABELS: List[str] = [label for _, label in TASK_STATUS_OPTIONS]
+_STATUS_INDEX: Dict[Optional[str], int] = {
+    value: idx for idx, (value, _) in enumerate(TASK_STATUS_OPTIONS)
+}
+_STATUS_VALID: FrozenSet[Optional[str]] = frozenset(_STATUS_INDEX)
+
+# Shared drawing resources, reused by every row instead of rebuilt per widget.
+_COLOR_SLATE = wx.Colour(15, 23, 42)
+_COLOR_RED = wx.Colour(185, 28, 28)
+_COLOR_MUTED = wx.Colour(71, 85, 105)
+_COLOR_PLACEHOLDER = wx.Colour(100, 116, 139)
+_COLOR_ROW_BG = wx.Colour(241, 245, 249)
+_COLOR_SELECTED_BORDER = wx.Colour(59, 130, 246)
+
+# Fonts need a running wx.App, so they are created on first use.
+_FONT_BOLD_11: Optional[wx.Font] = None
+_FONT_NORMAL_11: Optional[wx.Font] = None
+_FONT_ITALIC_10: Optional[wx.Font] = None
+
+
+def _ensure_fonts() -> None:
+    global _FONT_BOLD_11, _FONT_NORMAL_11, _FONT_ITALIC_10
+    if _FONT_BOLD_11 is not None or wx.GetApp() is None:
+        return
+    _FONT_BOLD_11 = wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+    _FONT_NORMAL_11 = wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+    _FONT_ITALIC_10 = wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL)
 
 
 @dataclass
@@ -45,8 +73,15 @@ def setup_dependency_list_panel(
     pane = wx.CollapsiblePane(main_window.sidebar, label="Dependency List")
     pane.SetForegroundColour(wx.Colour(0, 0, 0))
     main_window.collapsible_panes.append(pane)
-    if pane_changed_handler is not None:
-        pane.Bind(wx.EVT_COLLAPSIBLEPANE_CHANGED, pane_changed_handler)
+
+    def on_pane_changed(event: wx.CommandEvent) -> None:
+        # Catch up on rebuilds skipped while collapsed, before the sidebar re-lays out.
+        if not pane.IsCollapsed() and main_window._dep_list_dirty:
+            rebuild_dependency_list(main_window)
+        if pane_changed_handler is not None:
+            pane_changed_handler(event)
+
+    pane.Bind(wx.EVT_COLLAPSIBLEPANE_CHANGED, on_pane_changed)
     sidebar_sizer.Add(pane, 0, wx.EXPAND | wx.ALL, 5)
 
     inner = pane.GetPane()
@@ -54,7 +89,7 @@ def setup_dependency_list_panel(
 
     header_row = wx.BoxSizer(wx.HORIZONTAL)
     summary = wx.StaticText(inner, label="Dependency status will appear here.")
-    summary.SetForegroundColour(wx.Colour(15, 23, 42))
+    summary.SetForegroundColour(_COLOR_SLATE)
     header_row.Add(summary, 1, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 4)
     add_btn = wx.Button(inner, label="Add Task", size=(100, 28))
     add_btn.Bind(wx.EVT_BUTTON, lambda evt: _on_add_task(main_window))
@@ -63,28 +98,33 @@ def setup_dependency_list_panel(
 
     badge_row = wx.BoxSizer(wx.HORIZONTAL)
     ready_label = wx.StaticText(inner, label="Ready: 0")
-    ready_label.SetForegroundColour(wx.Colour(15, 23, 42))
+    ready_label.SetForegroundColour(_COLOR_SLATE)
     badge_row.Add(ready_label, 0, wx.ALL, 2)
     blocked_label = wx.StaticText(inner, label="Blocked: 0")
-    blocked_label.SetForegroundColour(wx.Colour(185, 28, 28))
+    blocked_label.SetForegroundColour(_COLOR_RED)
     badge_row.Add(blocked_label, 0, wx.ALL, 2)
     wrapper.Add(badge_row, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM, 4)
 
-    container = wx.Panel(inner)
-    container.SetBackgroundColour(wx.Colour(248, 250, 252))
-    list_sizer = wx.BoxSizer(wx.VERTICAL)
-    container.SetSizer(list_sizer)
-    wrapper.Add(container, 1, wx.EXPAND | wx.ALL, 2)
+    placeholder = wx.StaticText(inner, label="No tasks available yet.")
+    placeholder.SetForegroundColour(_COLOR_PLACEHOLDER)
+    wrapper.Add(placeholder, 0, wx.ALL, 8)
+
+    task_list = DependencyTaskVListBox(inner, main_window)
+    task_list.Hide()  # shown instead of the placeholder once there are tasks
+    wrapper.Add(task_list, 1, wx.EXPAND | wx.ALL, 2)
 
     inner.SetSizer(wrapper)
 
     # Store references on the main window for later updates
-    main_window.dependency_list_pane = pane
-    main_window.dependency_summary_label = summary
-    main_window.dependency_ready_label = ready_label
-    main_window.dependency_blocked_label = blocked_label
-    main_window.dependency_list_container = container
-    main_window.dependency_list_sizer = list_sizer
+    main_window._dep_refs = SimpleNamespace(
+        pane=pane,
+        summary=summary,
+        ready=ready_label,
+        blocked=blocked_label,
+        placeholder=placeholder,
+        task_list=task_list,
+    )
+    main_window._dep_list_dirty = True
 
     rebuild_dependency_list(main_window)
 
@@ -92,148 +132,223 @@ def setup_dependency_list_panel(
 def rebuild_dependency_list(main_window: "MainWindow") -> None:
     """Update the dependency list from the current graph."""
 
-    container: Optional[wx.Panel] = getattr(main_window, "dependency_list_container", None)
-    sizer: Optional[wx.BoxSizer] = getattr(main_window, "dependency_list_sizer", None)
-    summary_label: Optional[wx.StaticText] = getattr(
-        main_window, "dependency_summary_label", None
-    )
-    ready_label: Optional[wx.StaticText] = getattr(
-        main_window, "dependency_ready_label", None
-    )
-    blocked_label: Optional[wx.StaticText] = getattr(
-        main_window, "dependency_blocked_label", None
-    )
-
-    if not container or not sizer or not summary_label or not ready_label or not blocked_label:
+    refs: Optional[SimpleNamespace] = getattr(main_window, "_dep_refs", None)
+    if refs is None:
         return
+    task_list: DependencyTaskVListBox = refs.task_list
+    placeholder: wx.StaticText = refs.placeholder
+    summary_label: wx.StaticText = refs.summary
+    ready_label: wx.StaticText = refs.ready
+    blocked_label: wx.StaticText = refs.blocked
+
+    if refs.pane.IsCollapsed():
+        # Nothing in the pane is visible; rebuild once it is expanded.
+        main_window._dep_list_dirty = True
+        return
+    main_window._dep_list_dirty = False
 
     graph: Optional[Graph] = getattr(main_window, "current_graph", None)
 
-    container.Freeze()
-    for child in list(container.GetChildren()):
-        child.Destroy()
-
     if not graph or not graph.get_all_nodes():
         summary_label.SetLabel("Add nodes to view the dependency list.")
         ready_label.SetLabel("Ready: 0")
         blocked_label.SetLabel("Blocked: 0")
-        placeholder = wx.StaticText(container, label="No tasks available yet.")
-        placeholder.SetForegroundColour(wx.Colour(100, 116, 139))
-        sizer.Add(placeholder, 0, wx.ALL, 8)
-        container.Thaw()
-        container.Layout()
-        container.GetParent().Layout()
-        return
-
-    tasks = derive_task_rows(graph)
-    dependency_count = len(graph.get_all_edges())
-    summary_label.SetLabel(
-        f"Ordered automatically from {dependency_count} "
-        f"{'dependency' if dependency_count == 1 else 'dependencies'}."
-    )
-    ready_label.SetLabel(f"Ready: {sum(1 for task in tasks if task.status == 'ready')}")
-    blocked_status_count = sum(1 for task in tasks if read_task_status(task.node) == "blocked")
-    blocked_label.SetLabel(f"Blocked: {blocked_status_count}")
-
-    for task in tasks:
-        _add_task_row(main_window, container, sizer, task)
-
-    container.Thaw()
-    container.Layout()
-    container.GetParent().Layout()
-
-
-def _add_task_row(
-    main_window: "MainWindow",
-    container: wx.Panel,
-    sizer: wx.BoxSizer,
-    task: TaskRow,
-) -> None:
-    panel = wx.Panel(container)
-    panel.SetBackgroundColour(wx.Colour(241, 245, 249))
-    row_sizer = wx.BoxSizer(wx.VERTICAL)
-    panel.SetSizer(row_sizer)
-
-    header = wx.BoxSizer(wx.HORIZONTAL)
-    order_label = wx.StaticText(panel, label=str(task.order) if task.order else "—")
-    order_label.SetForegroundColour(wx.Colour(15, 23, 42))
-    order_label.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-    header.Add(order_label, 0, wx.RIGHT | wx.ALIGN_CENTER_VERTICAL, 6)
-
-    title = wx.StaticText(panel, label=format_node_label(task.node))
-    title.SetForegroundColour(wx.Colour(15, 23, 42))
-    title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
-    header.Add(title, 1, wx.ALIGN_CENTER_VERTICAL)
-
-    topo_status = None
-    if task.status == "blocked":
-        topo_status = wx.StaticText(panel, label="Resolve cycle")
-        topo_status.SetForegroundColour(wx.Colour(185, 28, 28))
-        topo_status.SetFont(
-            wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL)
+        task_list.set_tasks([], {}, {})
+    else:
+        tasks = derive_task_rows(graph)
+        dependency_count = len(graph.get_all_edges())
+        summary_label.SetLabel(
+            f"Ordered automatically from {dependency_count} "
+            f"{'dependency' if dependency_count == 1 else 'dependencies'}."
         )
-        header.Add(topo_status, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 6)
-
-    row_sizer.Add(header, 0, wx.EXPAND | wx.BOTTOM, 2)
-
-    prereq_text = (
-        "No prerequisites"
-        if not task.prerequisites
-        else "Depends on " + ", ".join(format_node_label(node) for node in task.prerequisites)
-    )
-    prereq_label = wx.StaticText(panel, label=prereq_text)
-    prereq_label.SetForegroundColour(wx.Colour(71, 85, 105))
-    row_sizer.Add(prereq_label, 0, wx.BOTTOM, 2)
-
-    dependents_summary = (
-        "Unblocks 0 tasks"
-        if not task.dependents
-        else f"Unblocks {len(task.dependents)} task{'s' if len(task.dependents) != 1 else ''}"
-    )
-    if task.dependents:
-        dependents_summary += f" • Next: {format_node_label(task.dependents[0])}"
-        if len(task.dependents) > 1:
-            dependents_summary += " +"
-    dependents_label = wx.StaticText(panel, label=dependents_summary)
-    dependents_label.SetForegroundColour(wx.Colour(71, 85, 105))
-    row_sizer.Add(dependents_label, 0, wx.BOTTOM, 4)
-
-    controls = wx.BoxSizer(wx.HORIZONTAL)
-    status_choice = wx.Choice(panel, choices=[label for _, label in TASK_STATUS_OPTIONS])
-    status_value = read_task_status(task.node)
-    selection_index = 0
-    for idx, (value, _) in enumerate(TASK_STATUS_OPTIONS):
-        if value == status_value:
-            selection_index = idx
-            break
-    status_choice.SetSelection(selection_index)
-    status_choice.Bind(
-        wx.EVT_CHOICE,
-        lambda event, node_id=task.node.id: _on_status_change(main_window, node_id, event),
-    )
-    controls.Add(status_choice, 0, wx.RIGHT, 6)
-
-    edit_btn = wx.Button(panel, label="Edit", size=(70, 26))
-    edit_btn.Bind(
-        wx.EVT_BUTTON,
-        lambda event, node_id=task.node.id: _on_edit_task(main_window, node_id),
-    )
-    controls.Add(edit_btn, 0, wx.RIGHT, 6)
-
-    delete_btn = wx.Button(panel, label="Delete", size=(80, 26))
-    delete_btn.SetForegroundColour(wx.Colour(185, 28, 28))
-    delete_btn.Bind(
-        wx.EVT_BUTTON,
-        lambda event, node_id=task.node.id: _on_delete_task(main_window, node_id),
-    )
-    controls.Add(delete_btn, 0)
-
-    row_sizer.Add(controls, 0, wx.BOTTOM, 4)
-    sizer.Add(panel, 0, wx.EXPAND | wx.ALL, 4)
+        ready_label.SetLabel(f"Ready: {sum(1 for task in tasks if task.status == 'ready')}")
+        # Labels and statuses are read once per rebuild and shared by every row.
+        labels = {task.node.id: format_node_label(task.node) for task in tasks}
+        statuses = {task.node.id: read_task_status(task.node) for task in tasks}
+        blocked_status_count = sum(1 for status in statuses.values() if status == "blocked")
+        blocked_label.SetLabel(f"Blocked: {blocked_status_count}")
+        task_list.set_tasks(tasks, labels, statuses)
+
+    has_tasks = task_list.GetItemCount() > 0
+    if placeholder.IsShown() == has_tasks:
+        placeholder.Show(not has_tasks)
+        task_list.Show(has_tasks)
+        task_list.GetParent().Layout()
+
+
+def _prerequisites_text(task: TaskRow, labels: Dict[str, str]) -> str:
+    if not task.prerequisites:
+        return "No prerequisites"
+    return "Depends on " + ", ".join(labels[node.id] for node in task.prerequisites)
+
+
+def _dependents_text(task: TaskRow, labels: Dict[str, str]) -> str:
+    if not task.dependents:
+        return "Unblocks 0 tasks"
+    summary = f"Unblocks {len(task.dependents)} task{'s' if len(task.dependents) != 1 else ''}"
+    summary += f" • Next: {labels[task.dependents[0].id]}"
+    if len(task.dependents) > 1:
+        summary += " +"
+    return summary
+
+
+class DependencyTaskVListBox(wx.VListBox):
+    """Owner-drawn, virtual list of dependency tasks.
+
+    Only the rows in view are painted, so the cost of a rebuild no longer
+    grows with one panel and six controls per task. Each row draws its own
+    status, Edit and Delete hot spots; clicks on them are hit-tested.
+    """
+
+    ROW_HEIGHT = 88
+    _PADDING = 8
+    _LINE_HEIGHT = 18
+
+    def __init__(self, parent: wx.Window, main_window: "MainWindow"):
+        super().__init__(parent, style=wx.LB_SINGLE | wx.BORDER_NONE)
+        _ensure_fonts()
+        self.main_window = main_window
+        self._tasks: List[TaskRow] = []
+        self._labels: Dict[str, str] = {}
+        self._statuses: Dict[str, Optional[str]] = {}
+        # Hot spots of each drawn row, relative to the row's top-left corner.
+        self._hit_regions: Dict[int, List[Tuple[wx.Rect, str]]] = {}
+        self.SetBackgroundColour(wx.Colour(248, 250, 252))
+        self.SetMinSize((-1, 360))
+        self.Bind(wx.EVT_LEFT_DOWN, self._on_left_down)
+        self.Bind(wx.EVT_LISTBOX_DCLICK, self._on_double_click)
+
+    def set_tasks(
+        self,
+        tasks: List[TaskRow],
+        labels: Dict[str, str],
+        statuses: Dict[str, Optional[str]],
+    ) -> None:
+        selected = self.GetSelection()
+        selected_id = self._tasks[selected].node.id if 0 <= selected < len(self._tasks) else None
+
+        self._tasks = tasks
+        self._labels = labels
+        self._statuses = statuses
+        self._hit_regions.clear()
+        self.SetItemCount(len(tasks))
+
+        selection = wx.NOT_FOUND
+        if selected_id is not None:
+            for index, task in enumerate(tasks):
+                if task.node.id == selected_id:
+                    selection = index
+                    break
+        self.SetSelection(selection)
+        self.RefreshAll()
+
+    def OnMeasureItem(self, n: int) -> int:
+        return self.ROW_HEIGHT
+
+    def OnDrawBackground(self, dc: wx.DC, rect: wx.Rect, n: int) -> None:
+        card = wx.Rect(rect)
+        card.Deflate(4, 4)
+        dc.SetPen(wx.Pen(_COLOR_SELECTED_BORDER) if self.IsSelected(n) else wx.TRANSPARENT_PEN)
+        dc.SetBrush(wx.Brush(_COLOR_ROW_BG))
+        dc.DrawRectangle(card)
+
+    def OnDrawItem(self, dc: wx.DC, rect: wx.Rect, n: int) -> None:
+        if not 0 <= n < len(self._tasks):
+            return
+        task = self._tasks[n]
+        pad, line = self._PADDING, self._LINE_HEIGHT
+        left = rect.x + pad
+        top = rect.y + pad
+        regions: List[Tuple[wx.Rect, str]] = []
+
+        with wx.DCClipper(dc, rect):
+            dc.SetFont(_FONT_BOLD_11)
+            dc.SetTextForeground(_COLOR_SLATE)
+            order_text = str(task.order) if task.order else "—"
+            dc.DrawText(order_text, left, top)
+            title_x = left + dc.GetTextExtent(order_text).width + 6
+
+            right = rect.x + rect.width - pad
+            if task.status == "blocked":
+                dc.SetFont(_FONT_ITALIC_10)
+                dc.SetTextForeground(_COLOR_RED)
+                cycle_text = "Resolve cycle"
+                right -= dc.GetTextExtent(cycle_text).width
+                dc.DrawText(cycle_text, right, top + 1)
+                right -= 6
+
+            dc.SetFont(_FONT_NORMAL_11)
+            dc.SetTextForeground(_COLOR_SLATE)
+            with wx.DCClipper(dc, wx.Rect(title_x, top, max(right - title_x, 0), line)):
+                dc.DrawText(self._labels[task.node.id], title_x, top)
+
+            dc.SetFont(self.GetFont())
+            dc.SetTextForeground(_COLOR_MUTED)
+            dc.DrawText(_prerequisites_text(task, self._labels), left, top + line)
+            dc.DrawText(_dependents_text(task, self._labels), left, top + 2 * line)
+
+            controls_y = top + 3 * line + 2
+            x = left
+            status_label = TASK_STATUS_OPTIONS[_STATUS_INDEX.get(self._statuses[task.node.id], 0)][1]
+            for text, action, colour in (
+                (f"{status_label} ▾", "status", _COLOR_SLATE),
+                ("Edit", "edit", _COLOR_SLATE),
+                ("Delete", "delete", _COLOR_RED),
+            ):
+                dc.SetTextForeground(colour)
+                width, height = dc.GetTextExtent(text)
+                dc.DrawText(text, x, controls_y)
+                regions.append((wx.Rect(x - rect.x, controls_y - rect.y, width, height), action))
+                x += width + 16
+
+        self._hit_regions[n] = regions
+
+    def _task_at(self, position: wx.Point) -> Tuple[int, Optional[str]]:
+        n = self.VirtualHitTest(position.y)
+        if n == wx.NOT_FOUND or not 0 <= n < len(self._tasks):
+            return wx.NOT_FOUND, None
+        origin = self.GetItemRect(n).GetTopLeft()
+        relative = wx.Point(position.x - origin.x, position.y - origin.y)
+        for region, action in self._hit_regions.get(n, ()):
+            if region.Contains(relative):
+                return n, action
+        return n, None
+
+    def _on_left_down(self, event: wx.MouseEvent) -> None:
+        n, action = self._task_at(event.GetPosition())
+        event.Skip()  # keep the default selection handling
+        if action is None:
+            return
+        node_id = self._tasks[n].node.id
+        # Run after the click is processed; the handlers rebuild the list.
+        if action == "status":
+            wx.CallAfter(self._show_status_menu, node_id)
+        elif action == "edit":
+            wx.CallAfter(_on_edit_task, self.main_window, node_id)
+        elif action == "delete":
+            wx.CallAfter(_on_delete_task, self.main_window, node_id)
+
+    def _on_double_click(self, event: wx.CommandEvent) -> None:
+        n = event.GetSelection()
+        if 0 <= n < len(self._tasks):
+            _on_edit_task(self.main_window, self._tasks[n].node.id)
+
+    def _show_status_menu(self, node_id: str) -> None:
+        current = _STATUS_INDEX.get(self._statuses.get(node_id), 0)
+        menu = wx.Menu()
+        for idx, label in enumerate(_STATUS_LABELS):
+            item = menu.AppendRadioItem(wx.ID_ANY, label)
+            item.Check(idx == current)
+            self.Bind(
+                wx.EVT_MENU,
+                lambda event, idx=idx: _on_status_change(self.main_window, node_id, idx),
+                item,
+            )
+        self.PopupMenu(menu)
+        menu.Destroy()
 
 
-def _on_status_change(main_window: "MainWindow", node_id: str, event: wx.CommandEvent) -> None:
-    selection = event.GetSelection()
+def _on_status_change(main_window: "MainWindow", node_id: str, selection: int) -> None:
     status_value = TASK_STATUS_OPTIONS[selection][0]
     main_window.dependency_list_set_status(node_id, status_value)
 
@@ -279,79 +394,50 @@ def derive_task_rows(graph: Optional[Graph]) -> List[TaskRow]:
         return []
 
     nodes = graph.get_all_nodes()
-    edges = graph.get_all_edges()
-    node_map = {node.id: node for node in nodes}
-
-    prerequisites = {node.id: set() for node in nodes}
-    dependents = {node.id: set() for node in nodes}
-
-    for edge in edges:
-        sources = _gather_members(edge, "source")
-        targets = _gather_members(edge, "target")
-        for source_id in sources:
-            for target_id in targets:
-                if source_id == target_id:
-                    continue
-                prerequisites[target_id].add(source_id)
-                dependents[source_id].add(target_id)
-
-    original_prereqs = {node_id: sorted(ids) for node_id, ids in prerequisites.items()}
-    original_dependents = {node_id: sorted(ids) for node_id, ids in dependents.items()}
-
-    ready: List[str] = sorted(
-        [node_id for node_id, reqs in prerequisites.items() if not reqs],
-        key=lambda node_id: _node_sort_key(node_map.get(node_id)),
-    )
-    visited = set()
-    ordered_rows: List[TaskRow] = []
-
-    while ready:
-        current_id = ready.pop(0)
-        if current_id in visited:
-            continue
-        visited.add(current_id)
-        ordered_rows.append(
-            TaskRow(
-                node=node_map[current_id],
-                order=len(ordered_rows) + 1,
-                prerequisites=[node_map[node_id] for node_id in original_prereqs[current_id] if node_id in node_map],
-                dependents=[node_map[node_id] for node_id in original_dependents[current_id] if node_id in node_map],
-                status="ready",
-            )
-        )
-        for dependent_id in list(dependents[current_id]):
-            prerequisites[dependent_id].discard(current_id)
-            if not prerequisites[dependent_id] and dependent_id not in visited:
-                ready.append(dependent_id)
-        ready.sort(key=lambda node_id: _node_sort_key(node_map.get(node_id)))
-
-    blocked_rows: List[TaskRow] = []
-    for node in nodes:
-        if node.id in visited:
-            continue
-        blocked_rows.append(
-            TaskRow(
-                node=node,
-                order=None,
-                prerequisites=[node_map[node_id] for node_id in original_prereqs[node.id] if node_id in node_map],
-                dependents=[node_map[node_id] for node_id in original_dependents[node.id] if node_id in node_map],
-                status="blocked",
-            )
+    # Work on dense integer indices; ids only matter for display order.
+    index = {node.id: position for position, node in enumerate(nodes)}
+
+    # Adjacency is cached on the graph until it changes, so repeated rebuilds
+    # only re-run the ordering.
+    prereq_ids, dependent_ids = graph.get_adjacency()
+    prerequisites: List[List[int]] = [[index[other] for other in prereq_ids[node.id]] for node in nodes]
+    dependents: List[List[int]] = [[index[other] for other in dependent_ids[node.id]] for node in nodes]
+
+    def by_id(other: int) -> str:
+        return nodes[other].id
+
+    def build_row(position: int, order: Optional[int], status: str) -> TaskRow:
+        return TaskRow(
+            node=nodes[position],
+            order=order,
+            prerequisites=[nodes[other] for other in sorted(prerequisites[position], key=by_id)],
+            dependents=[nodes[other] for other in sorted(dependents[position], key=by_id)],
+            status=status,
         )
-    blocked_rows.sort(key=lambda task: _node_sort_key(task.node))
 
-    return ordered_rows + blocked_rows
+    # Kahn's algorithm over in-degree counters: a task becomes ready when its
+    # count of unplaced prerequisites drops to zero.
+    sort_keys = [_node_sort_key(node) for node in nodes]
+    remaining = [len(reqs) for reqs in prerequisites]
+    ready: List[Tuple[Tuple[float, float, str], int]] = [
+        (sort_keys[position], position) for position, count in enumerate(remaining) if not count
+    ]
+    heapq.heapify(ready)
+    placed = [False] * len(nodes)
+    ordered_rows: List[TaskRow] = []
 
+    while ready:
+        _, current = heapq.heappop(ready)
+        placed[current] = True
+        ordered_rows.append(build_row(current, len(ordered_rows) + 1, "ready"))
+        for dependent in dependents[current]:
+            remaining[dependent] -= 1
+            if not remaining[dependent]:
+                heapq.heappush(ready, (sort_keys[dependent], dependent))
 
-def _gather_members(edge: Edge, position: str) -> List[str]:
-    ids = set()
-    singular = edge.source_id if position == "source" else edge.target_id
-    if singular:
-        ids.add(singular)
-    list_attr = edge.source_ids if position == "source" else edge.target_ids
-    if isinstance(list_attr, list):
-        ids.update(node_id for node_id in list_attr if isinstance(node_id, str))
-    return list(ids)
+    blocked = [position for position in range(len(nodes)) if not placed[position]]
+    blocked.sort(key=sort_keys.__getitem__)
+    return ordered_rows + [build_row(position, None, "blocked") for position in blocked]
 
 
 def _node_sort_key(node: Optional[Node]) -> Tuple[float, float, str]:
@@ -378,10 +464,8 @@ def read_numeric_metadata(node: Node, key: str) -> Optional[float]:
 def read_task_status(node: Node) -> Optional[str]:
     metadata = node.metadata or {}
     status = metadata.get("status")
-    if isinstance(status, str):
-        for value, _ in TASK_STATUS_OPTIONS:
-            if value == status:
-                return status
+    if isinstance(status, str) and status in _STATUS_VALID:
+        return status
     return None
 
 
@@ -414,7 +498,7 @@ class DependencyTaskDialog(wx.Dialog):
         panel.SetSizer(sizer)
 
         label_text = wx.StaticText(panel, label="Task Label")
-        label_text.SetForegroundColour(wx.Colour(15, 23, 42))
+        label_text.SetForegroundColour(_COLOR_SLATE)
         sizer.Add(label_text, 0, wx.ALL, 8)
         self.label_input = wx.TextCtrl(panel, value=node.text if node else "")
         sizer.Add(self.label_input, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 8)
@@ -425,35 +509,40 @@ class DependencyTaskDialog(wx.Dialog):
             if not node or candidate.id != node.id
         ]
         self.choice_ids = [choice[0] for choice in choices]
+        self._id_to_index: Dict[str, int] = {
+            candidate_id: idx for idx, candidate_id in enumerate(self.choice_ids)
+        }
         display_labels = [choice[1] for choice in choices]
 
         prereq_label = wx.StaticText(panel, label="Prerequisites (must happen before)")
-        prereq_label.SetForegroundColour(wx.Colour(15, 23, 42))
+        prereq_label.SetForegroundColour(_COLOR_SLATE)
         sizer.Add(prereq_label, 0, wx.ALL, 8)
         self.prereq_list = wx.CheckListBox(panel, choices=display_labels)
         sizer.Add(self.prereq_list, 1, wx.EXPAND | wx.LEFT | wx.RIGHT, 8)
 
         post_label = wx.StaticText(panel, label="Postrequisites (happen after this task)")
-        post_label.SetForegroundColour(wx.Colour(15, 23, 42))
+        post_label.SetForegroundColour(_COLOR_SLATE)
         sizer.Add(post_label, 0, wx.ALL, 8)
         self.post_list = wx.CheckListBox(panel, choices=display_labels)
         sizer.Add(self.post_list, 1, wx.EXPAND | wx.LEFT | wx.RIGHT, 8)
 
         if node:
-            prereq_ids = {
-                edge.source_id
-                for edge in graph.get_all_edges()
-                if edge.target_id == node.id
-            }
-            post_ids = {
-                edge.target_id
-                for edge in graph.get_all_edges()
-                if edge.source_id == node.id
-            }
-            for idx, candidate_id in enumerate(self.choice_ids):
-                if candidate_id in prereq_ids:
+            # One pass over the edges collects both directions.
+            prereq_ids: Set[str] = set()
+            post_ids: Set[str] = set()
+            node_id = node.id
+            for edge in graph.get_all_edges():
+                if edge.target_id == node_id:
+                    prereq_ids.add(edge.source_id)
+                if edge.source_id == node_id:
+                    post_ids.add(edge.target_id)
+            for candidate_id in prereq_ids:
+                idx = self._id_to_index.get(candidate_id)
+                if idx is not None:
                     self.prereq_list.Check(idx)
-                if candidate_id in post_ids:
+            for candidate_id in post_ids:
+                idx = self._id_to_index.get(candidate_id)
+                if idx is not None:
                     self.post_list.Check(idx)
 
         btn_sizer = self.CreateStdDialogButtonSizer(wx.OK | wx.CANCEL)
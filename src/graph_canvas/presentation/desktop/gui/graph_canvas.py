@@ -5405,7 +5405,8 @@ class GraphCanvas(wx.Panel, GraphCanvasPropertyNotifierMixin):
         except Exception:
             pass
         if dialog.ShowModal() == wx.ID_OK:
-            # Edge was updated by dialog
+            # Edge was updated by dialog, possibly rewiring its endpoints
+            self.graph.invalidate_adjacency()
             self.graph_modified.emit()
             self.Refresh()
         dialog.Destroy()
@@ -5525,6 +5526,7 @@ class GraphCanvas(wx.Panel, GraphCanvasPropertyNotifierMixin):
                     edge.source_id = None
                 if getattr(edge, 'target_id', None) == node_id:
                     edge.target_id = None
+                self.graph.invalidate_adjacency()
                 # Remove any per-node arrow position
                 if hasattr(edge, 'metadata') and isinstance(edge.metadata, dict):
                     nmap = edge.metadata.get('arrow_pos_nodes') or {}
@@ -7605,6 +7607,7 @@ class GraphCanvas(wx.Panel, GraphCanvasPropertyNotifierMixin):
                     target_node.remove_redirected_edge(edge_id)
 
             print(f"DEBUG: 📖 Restored {edges_restored} edges from container")
+            self.graph.invalidate_adjacency()
 
             # Mark graph as modified
             if hasattr(self, 'graph_modified'):
@@ -7688,6 +7691,7 @@ class GraphCanvas(wx.Panel, GraphCanvasPropertyNotifierMixin):
                     edges_redirected += 1
 
             print(f"DEBUG: 📕 Redirected {edges_redirected} edges to container")
+            self.graph.invalidate_adjacency()
 
             # Mark graph as modified
             if hasattr(self, 'graph_modified'):
@@ -8236,6 +8240,7 @@ class GraphCanvas(wx.Panel, GraphCanvasPropertyNotifierMixin):
                         e1.directed = True
                     except Exception:
                         pass
+                    self.graph.invalidate_adjacency()
                     self.graph_modified.emit()
                     self.Refresh()
                 except Exception as _e:
@@ -8264,6 +8269,7 @@ class GraphCanvas(wx.Panel, GraphCanvasPropertyNotifierMixin):
                     if end_node.id not in e1.target_ids and end_node.id != getattr(
                             e1, 'target_id', None):
                         e1.target_ids.append(end_node.id)
+                    self.graph.invalidate_adjacency()
                     self.graph_modified.emit()
                     self.Refresh()
                 except Exception:
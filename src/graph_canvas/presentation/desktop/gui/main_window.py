@@ -337,20 +337,43 @@ class MainWindow(wx.Frame):
     def _maybe_load_from_backend(self):
         """Fetch graph from backend on startup if the server is available."""
         try:
-            if self.backend.is_available():
-                data = self.backend.get_graph()
-                if data and isinstance(data, dict) and data.get('nodes') is not None:
-                    try:
-                        self.current_graph = m_graph.Graph.from_dict(data)
-                        self.graphs[self.current_graph.id] = self.current_graph
-                        if hasattr(self, 'canvas'):
-                            self.canvas.set_graph(self.current_graph, emit_signal=False)
-                        print("DEBUG: Loaded graph state from backend")
-                    except Exception as e:
-                        print(f"DEBUG: Error constructing graph from backend: {e}")
+            self.backend.check_available().add_done_callback(self._on_backend_probed)
         except Exception as e:
             print(f"DEBUG: Backend not available: {e}")
 
+    def _on_backend_probed(self, future) -> None:
+        """Request the backend graph once the startup health probe succeeds (worker thread)."""
+        try:
+            if future.result():
+                self.backend.get_graph().add_done_callback(self._on_backend_graph_fetched)
+        except Exception as e:
+            print(f"DEBUG: Backend probe failed: {e}")
+
+    def _on_backend_graph_fetched(self, future) -> None:
+        """Hand the fetched graph to the GUI thread (worker thread)."""
+        try:
+            data = future.result()
+        except Exception as e:
+            print(f"DEBUG: Failed to fetch graph from backend: {e}")
+            return
+        wx.CallAfter(self._apply_backend_graph, data)
+
+    def _apply_backend_graph(self, data) -> None:
+        """Install a graph fetched from the backend (runs on the GUI thread)."""
+        if self.current_graph.modified:
+            # The user started editing before the fetch landed; keep their work.
+            print("DEBUG: Skipping backend graph, local graph has unsaved changes")
+            return
+        if data and isinstance(data, dict) and data.get('nodes') is not None:
+            try:
+                self.current_graph = m_graph.Graph.from_dict(data)
+                self.graphs[self.current_graph.id] = self.current_graph
+                if hasattr(self, 'canvas'):
+                    self.canvas.set_graph(self.current_graph, emit_signal=False)
+                print("DEBUG: Loaded graph state from backend")
+            except Exception as e:
+                print(f"DEBUG: Error constructing graph from backend: {e}")
+
 
     def on_horizontal_splitter_changed(self, event):
         """Handle horizontal splitter (sidebar) position changes."""
@@ -1031,15 +1054,25 @@ class MainWindow(wx.Frame):
         self.update_ui()
 
 
+    def _available_backend(self):
+        """The backend client if it was last seen up; never blocks on the network."""
+
+        backend = getattr(self, "backend", None)
+        if backend is None or not backend.is_available():
+            return None
+        return backend
+
+
     def _sync_node_to_backend(self, node_id: str, payload: dict) -> None:
         """Attempt to mirror node updates to the backend API."""
 
-        backend = getattr(self, "backend", None)
-        if not backend or not backend.is_available():
+        backend = self._available_backend()
+        if backend is None:
             return
         try:
-            if not backend.update_node(self.current_graph.id, node_id, payload):
-                backend.set_graph(self.current_graph.to_dict())
+            backend.update_node(self.current_graph.id, node_id, payload).add_done_callback(
+                self._resync_on_failure
+            )
         except Exception as exc:
             print(f"DEBUG: Failed to sync node update for {node_id}: {exc}")
 
@@ -1047,21 +1080,29 @@ class MainWindow(wx.Frame):
     def _sync_node_deletion(self, node_id: str) -> None:
         """Attempt to mirror node deletions to the backend API."""
 
-        backend = getattr(self, "backend", None)
-        if not backend or not backend.is_available():
+        backend = self._available_backend()
+        if backend is None:
             return
         try:
-            if not backend.delete_node(self.current_graph.id, node_id):
-                backend.set_graph(self.current_graph.to_dict())
+            backend.delete_node(self.current_graph.id, node_id).add_done_callback(
+                self._resync_on_failure
+            )
         except Exception as exc:
             print(f"DEBUG: Failed to sync node deletion for {node_id}: {exc}")
 
 
+    def _resync_on_failure(self, future) -> None:
+        """Fall back to a full snapshot when an incremental backend update fails."""
+
+        if not future.result():
+            wx.CallAfter(self._sync_full_graph)
+
+
     def _sync_full_graph(self) -> None:
         """Best-effort sync of the full graph snapshot to the backend."""
 
-        backend = getattr(self, "backend", None)
-        if not backend or not backend.is_available():
+        backend = self._available_backend()
+        if backend is None:
             return
         try:
             backend.set_graph(self.current_graph.to_dict())
@@ -1126,6 +1167,7 @@ class MainWindow(wx.Frame):
         # Save settings
         self.managers.layout_manager.save_settings()
         self.managers.file_manager.save_recent_files()
+        self.backend.close()
         
         # Allow closing
         event.Skip()
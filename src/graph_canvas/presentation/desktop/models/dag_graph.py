@@ -3,6 +3,7 @@ Directed Acyclic Graph (DAG) model.
 """
 
 
+from collections import deque
 from typing import Dict, List, Set, Optional, Any, Tuple
 
 import graph_canvas.presentation.desktop.models.base_graph as m_base_graph
@@ -98,10 +99,10 @@ class DAGGraph(m_base_graph.BaseGraph):
             in_degree[edge.target_id] += 1
         
         # Start with nodes that have no incoming edges
-        queue = [node.id for node, degree in in_degree.items() if degree == 0]
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(self.get_node(current))
             
             # Reduce in-degree of neighbors
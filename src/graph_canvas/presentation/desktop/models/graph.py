@@ -5,11 +5,13 @@ Graph model for the graph editor.
 
 import json
 import uuid
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Set
 
 import graph_canvas.presentation.desktop.models.node as m_node
 import graph_canvas.presentation.desktop.models.edge as m_edge
 
+Adjacency = Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]
+
 
 class Graph:
     """
@@ -37,6 +39,10 @@ class Graph:
         self.nodes: Dict[str, m_node.Node] = {}
         self.edges: Dict[str, Edge] = {}
 
+        # Derived adjacency, rebuilt lazily once the graph has changed
+        self._adjacency_version = 0
+        self._cached_adjacency: Optional[Tuple[Tuple[int, int, int], Adjacency]] = None
+
         # Graph properties
         self.selected_nodes: Set[str] = set()
         self.selected_edges: Set[str] = set()
@@ -49,6 +55,53 @@ class Graph:
         self.grid_size = 20
         self.grid_color = (200, 200, 200)  # Darker grid for better contrast
 
+    @property
+    def modified(self) -> bool:
+        return self._modified
+
+    @modified.setter
+    def modified(self, value: bool):
+        # Every mutation path flags the graph as modified, so this doubles as
+        # the invalidation hook for derived data.
+        self._modified = value
+        if value:
+            self._adjacency_version += 1
+
+    def invalidate_adjacency(self):
+        """Drop cached adjacency after rewiring edge endpoints in place."""
+
+        self._adjacency_version += 1
+
+    def get_adjacency(self) -> Adjacency:
+        """
+        Get (prerequisites, dependents): for each node id, the ids of the nodes
+        feeding into it and the ids it feeds, hyperedge members included.
+
+        The result is cached until the graph changes and must not be mutated.
+        """
+
+        key = (self._adjacency_version, len(self.nodes), len(self.edges))
+        cached = self._cached_adjacency
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        prerequisites: Dict[str, Set[str]] = {node_id: set() for node_id in self.nodes}
+        dependents: Dict[str, Set[str]] = {node_id: set() for node_id in self.nodes}
+        for edge in self.edges.values():
+            targets = tuple(_edge_members(edge, "target"))
+            for source_id in _edge_members(edge, "source"):
+                if source_id not in dependents:
+                    continue
+                for target_id in targets:
+                    if source_id == target_id or target_id not in prerequisites:
+                        continue
+                    prerequisites[target_id].add(source_id)
+                    dependents[source_id].add(target_id)
+
+        adjacency = (prerequisites, dependents)
+        self._cached_adjacency = (key, adjacency)
+        return adjacency
+
     def add_node(self, node: m_node.Node) -> str:
         """Add a node to the graph."""
 
@@ -497,3 +550,16 @@ class Graph:
         """String representation of the graph."""
 
         return self.__str__()
+
+
+def _edge_members(edge: m_edge.Edge, position: str) -> Iterator[str]:
+    singular = edge.source_id if position == "source" else edge.target_id
+    list_attr = edge.source_ids if position == "source" else edge.target_ids
+    if singular:
+        yield singular
+    # Plain edges mirror the endpoint in a one-item list; nothing more to yield.
+    if not isinstance(list_attr, list) or (len(list_attr) <= 1 and singular in list_attr):
+        return
+    for node_id in list_attr:
+        if isinstance(node_id, str) and node_id != singular:
+            yield node_id
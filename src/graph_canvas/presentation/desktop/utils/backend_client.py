@@ -4,108 +4,284 @@ Simple HTTP client to communicate with the FastAPI backend.
 
 from __future__ import annotations
 
-import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import msgspec
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+from graph_canvas.infrastructure.serialization import orjson_default
+
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+
+
+def _dumps(payload) -> bytes:
+    # Bodies are encoded here in C rather than by requests' json= (stdlib json).
+    # Non-string keys are stringified like json.dumps does; numpy arrays and
+    # sets in node data encode the same way the server persists them.
+    return orjson.dumps(
+        payload,
+        default=orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
 
 
 class BackendClient:
+    """Talks to the backend without blocking the GUI thread.
+
+    Graph and node calls run on a background worker and return a
+    ``concurrent.futures.Future``; GUI code should hand results back with
+    ``future.add_done_callback(lambda f: wx.CallAfter(handler, f.result()))``.
+    The blocking implementations never raise, they resolve to ``None`` /
+    ``False`` on failure. All network I/O, health probes included, happens
+    on the worker, so the session is never used from two threads.
+    """
+
+    # Position updates arriving within this window are sent as one request.
+    POSITION_FLUSH_DELAY = 0.05
+    # How long a health probe result is trusted before is_available re-probes.
+    AVAILABILITY_TTL = 5.0
+    # Longest close() waits for queued calls and the final position flush.
+    CLOSE_TIMEOUT = 1.0
+
     def __init__(self, base_url: str = "http://127.0.0.1:8000") -> None:
         self.base_url = base_url.rstrip("/")
+        # One keep-alive session for the app's lifetime instead of a new
+        # connection per call.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Content-Type"] = "application/json"
+        self._positions_lock = threading.Lock()
+        self._pending_positions: Dict[str, Tuple[float, float]] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        # Health route that last answered: "/healthz" is the graph-scoped API,
+        # "/health" the legacy backend.
+        self._health_endpoint: Optional[str] = None
+        # Cleared if the server rejects msgpack; positions then go out as JSON.
+        self._positions_msgpack = True
+        # Last probe result and when it landed (monotonic); None until the first probe.
+        self._available = True
+        self._available_at: Optional[float] = None
+        self._probe_pending = False
+        self._probe_lock = threading.Lock()
+        # A single worker keeps mutations reaching the server in the order issued.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backend-client")
+
+    def close(self) -> None:
+        """Send the last positions, waiting at most ``CLOSE_TIMEOUT``, then stop.
+
+        Calls still queued after that are cancelled so closing the window
+        never hangs on a slow or unreachable server.
+        """
+
+        flushed = self._executor.submit(self.flush_positions)
+        try:
+            flushed.result(timeout=self.CLOSE_TIMEOUT)
+        except FutureTimeoutError:
+            pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
+    def __enter__(self) -> "BackendClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_graph(self) -> "Future[Optional[Dict]]":
+        return self._executor.submit(self._get_graph)
+
+    def set_graph(self, graph_dict: Dict) -> "Future[bool]":
+        return self._executor.submit(self._set_graph, graph_dict)
+
+    def create_node(self, x: float, y: float, text: str = "") -> "Future[Optional[Dict]]":
+        return self._executor.submit(self._create_node, x, y, text)
+
+    def create_edge(self, source_id: str, target_id: str, text: str = "") -> "Future[Optional[Dict]]":
+        return self._executor.submit(self._create_edge, source_id, target_id, text)
+
+    def update_node(self, graph_id: str, node_id: str, payload: Dict) -> "Future[bool]":
+        return self._executor.submit(self._update_node, graph_id, node_id, payload)
+
+    def delete_node(self, graph_id: str, node_id: str) -> "Future[bool]":
+        return self._executor.submit(self._delete_node, graph_id, node_id)
+
+    def check_available(self) -> "Future[bool]":
+        """Probe the server's health route on the worker."""
+
+        with self._probe_lock:
+            self._probe_pending = True
+        return self._executor.submit(self._probe_available)
 
     def is_available(self) -> bool:
+        """Last known availability; safe to call on the GUI thread.
+
+        Never touches the network itself: once the cached result is older
+        than ``AVAILABILITY_TTL`` a fresh probe is queued on the worker and the
+        previous answer is returned meanwhile. Until the first probe lands the
+        server is assumed up, so early calls are queued rather than dropped.
+        """
+
+        with self._probe_lock:
+            stale = (
+                self._available_at is None
+                or time.monotonic() - self._available_at > self.AVAILABILITY_TTL
+            )
+            if stale and not self._probe_pending:
+                self._probe_pending = True
+                self._executor.submit(self._probe_available)
+            return self._available
+
+    @property
+    def supports_graph_scoped(self) -> bool:
+        """Whether the server exposes the /graphs/{graph_id}/... routes (probed once).
+
+        Blocks on the first call, so only use it from the worker.
+        """
+
+        if self._health_endpoint is None:
+            self._probe_available()
+        return self._health_endpoint == "/healthz"
+
+    def _probe_available(self) -> bool:
         endpoints = ("/healthz", "/health")
+        if self._health_endpoint == "/health":
+            endpoints = ("/health", "/healthz")
+        available = False
         for endpoint in endpoints:
             try:
-                r = requests.get(f"{self.base_url}{endpoint}", timeout=1.0)
+                r = self._session.get(f"{self.base_url}{endpoint}", timeout=1.0)
                 if r.status_code == 200:
-                    return True
+                    self._health_endpoint = endpoint
+                    available = True
+                    break
             except Exception:
                 continue
-        return False
+        with self._probe_lock:
+            self._available = available
+            self._available_at = time.monotonic()
+            self._probe_pending = False
+        return available
 
-    def get_graph(self) -> Optional[Dict]:
+    def _get_graph(self) -> Optional[Dict]:
         try:
-            r = requests.get(f"{self.base_url}/graph", timeout=2.0)
+            r = self._session.get(f"{self.base_url}/graph", timeout=2.0)
             if r.ok:
-                return r.json()
+                return orjson.loads(r.content)
         except Exception:
             pass
         return None
 
-    def set_graph(self, graph_dict: Dict) -> bool:
+    def _set_graph(self, graph_dict: Dict) -> bool:
         try:
-            r = requests.post(f"{self.base_url}/graph", json=graph_dict, timeout=3.0)
+            r = self._session.post(f"{self.base_url}/graph", data=_dumps(graph_dict), timeout=3.0)
             return r.ok
         except Exception:
             return False
 
     def patch_node_positions(self, items: Iterable[Tuple[str, float, float]]) -> bool:
-        payload = [{"id": nid, "x": x, "y": y} for nid, x, y in items]
+        """Queue position updates; a drag's bursts are coalesced per node and sent shortly after."""
+
+        with self._positions_lock:
+            for nid, x, y in items:
+                self._pending_positions[nid] = (x, y)
+            if self._flush_timer is None:
+                # Flush on the worker so positions stay ordered with other mutations.
+                self._flush_timer = threading.Timer(self.POSITION_FLUSH_DELAY, self._submit_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        return True
+
+    def _submit_flush(self) -> None:
+        try:
+            self._executor.submit(self.flush_positions)
+        except RuntimeError:
+            pass  # closed; close() already queued a final flush
+
+    def flush_positions(self) -> bool:
+        """Send any queued position updates now."""
+
+        with self._positions_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending, self._pending_positions = self._pending_positions, {}
+        if not pending:
+            return True
+        url = f"{self.base_url}/nodes/positions"
         try:
-            r = requests.patch(f"{self.base_url}/nodes/positions", json=payload, timeout=2.5)
+            if self._positions_msgpack:
+                r = self._session.patch(
+                    url,
+                    data=_MSGPACK_ENCODER.encode([(nid, x, y) for nid, (x, y) in pending.items()]),
+                    headers={"Content-Type": "application/msgpack"},
+                    timeout=2.5,
+                )
+                if r.status_code not in (415, 422):
+                    return r.ok
+                self._positions_msgpack = False
+            payload = [{"id": nid, "x": x, "y": y} for nid, (x, y) in pending.items()]
+            r = self._session.patch(url, data=_dumps(payload), timeout=2.5)
             return r.ok
         except Exception:
             return False
 
-    def create_node(self, x: float, y: float, text: str = "") -> Optional[Dict]:
+    def _create_node(self, x: float, y: float, text: str = "") -> Optional[Dict]:
         try:
-            r = requests.post(f"{self.base_url}/nodes", json={"x": x, "y": y, "text": text}, timeout=2.5)
+            r = self._session.post(f"{self.base_url}/nodes", data=_dumps({"x": x, "y": y, "text": text}), timeout=2.5)
             if r.ok:
-                return r.json()
+                return orjson.loads(r.content)
         except Exception:
             pass
         return None
 
-    def create_edge(self, source_id: str, target_id: str, text: str = "") -> Optional[Dict]:
+    def _create_edge(self, source_id: str, target_id: str, text: str = "") -> Optional[Dict]:
         try:
-            r = requests.post(
+            r = self._session.post(
                 f"{self.base_url}/edges",
-                json={"source_id": source_id, "target_id": target_id, "text": text},
+                data=_dumps({"source_id": source_id, "target_id": target_id, "text": text}),
                 timeout=2.5,
             )
             if r.ok:
-                return r.json()
+                return orjson.loads(r.content)
         except Exception:
             pass
         return None
 
-    def update_node(self, graph_id: str, node_id: str, payload: Dict) -> bool:
+    def _update_node(self, graph_id: str, node_id: str, payload: Dict) -> bool:
         """Update a node using the graph-scoped API."""
 
         try:
-            r = requests.patch(
+            r = self._session.patch(
                 f"{self.base_url}/graphs/{graph_id}/nodes/{node_id}",
-                json=payload,
+                data=_dumps(payload),
                 timeout=2.5,
             )
             return r.ok
         except Exception:
             return False
 
-    def delete_node(self, graph_id: str, node_id: str) -> bool:
-        """Delete a node via the API with compatibility fallback."""
-
-        try:
-            r = requests.delete(
-                f"{self.base_url}/graphs/{graph_id}/nodes/{node_id}",
-                timeout=2.5,
-            )
-            if r.ok:
-                return True
-        except Exception:
-            pass
+    def _delete_node(self, graph_id: str, node_id: str) -> bool:
+        """Delete a node via whichever endpoint the server supports."""
 
-        # Fallback to legacy endpoint
         try:
-            r = requests.delete(f"{self.base_url}/nodes/{node_id}", timeout=2.5)
+            if self.supports_graph_scoped:
+                r = self._session.delete(
+                    f"{self.base_url}/graphs/{graph_id}/nodes/{node_id}",
+                    timeout=2.5,
+                )
+                # Only an unknown graph falls through to the workspace route;
+                # timeouts are not retried.
+                if r.status_code != 404:
+                    return r.ok
+            r = self._session.delete(f"{self.base_url}/nodes/{node_id}", timeout=2.5)
             return r.ok
         except Exception:
             return False
-
-
-
-
-
-
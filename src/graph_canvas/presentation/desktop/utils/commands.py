@@ -177,6 +177,7 @@ class ChangeEdgeConnectionCommand(Command):
         if edge:
             edge.source_id = self.new_source_id
             edge.target_id = self.new_target_id
+            self.graph.invalidate_adjacency()
     
     def undo(self) -> None:
         """Restore the old connection."""
@@ -185,6 +186,7 @@ class ChangeEdgeConnectionCommand(Command):
         if edge:
             edge.source_id = self.old_source_id
             edge.target_id = self.old_target_id
+            self.graph.invalidate_adjacency()
 
 
 class EditPropertiesCommand(Command):
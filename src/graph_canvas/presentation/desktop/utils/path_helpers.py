@@ -4,20 +4,26 @@ both when running as a source checkout (python -m main) and when installed as a
 package (entry points).
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Resolved once; both helpers are called from many modules at import time.
+_MODULE_PATH = Path(__file__).resolve()
+_MVC_MVU_SIBLING = os.path.join(os.path.dirname(os.path.dirname(str(_MODULE_PATH))), 'MVC_MVU')
 
+
+@functools.lru_cache(maxsize=8)
 def ensure_project_on_path(anchor_file: Optional[str] = None) -> None:
     """Ensure project root is on sys.path for direct execution.
 
     If anchor_file is provided, it is used to resolve the project root; otherwise
-    we walk up from this file.
+    we walk up from this file. Each anchor is only resolved once per process.
     """
     try:
-        current = Path(anchor_file).resolve() if anchor_file else Path(__file__).resolve()
+        current = Path(anchor_file).resolve() if anchor_file else _MODULE_PATH
         project_root = current.parent if current.is_file() else current
         # bubble up to repo root (contains src/)
         for _ in range(3):
@@ -32,14 +38,11 @@ def ensure_project_on_path(anchor_file: Optional[str] = None) -> None:
         pass
 
 
+@functools.lru_cache(maxsize=1)
 def ensure_mvc_mvu_on_path() -> None:
     """Ensure the optional MVC_MVU sibling repo is importable if present."""
     try:
-        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sibling = os.path.join(root, 'MVC_MVU')
-        if os.path.isdir(sibling) and sibling not in sys.path:
-            sys.path.insert(0, sibling)
+        if os.path.isdir(_MVC_MVU_SIBLING) and _MVC_MVU_SIBLING not in sys.path:
+            sys.path.insert(0, _MVC_MVU_SIBLING)
     except Exception:
         pass
-
-
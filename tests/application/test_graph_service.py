@@ -1,18 +1,8 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import pytest
 
-ROOT = Path(__file__).resolve().parents[2]
-SRC = ROOT / "src"
-for path in (ROOT, SRC):
-    path_str = str(path)
-    if path_str not in sys.path:
-        sys.path.insert(0, path_str)
-
-from graph_canvas.application.dto import GraphCreateDTO, GraphUpdateDTO, NodeDTO
+from graph_canvas.application.dto import GraphUpdateDTO, NodeDTO
 from graph_canvas.application.graph_service import GraphService
 from graph_canvas.domain.entities import Edge, Graph, Node
 from graph_canvas.domain.exceptions import (
@@ -20,134 +10,174 @@ from graph_canvas.domain.exceptions import (
     GraphAlreadyExistsError,
     NodeNotFoundError,
 )
-from tests.support.mocks import MockGraphRepository
 
 
-def test_create_graph_persists_data():
-    repo = MockGraphRepository()
+def test_create_graph_persists_data(repo_factory, make_create_dto):
+    repo = repo_factory()
     service = GraphService(repo)
 
-    service.create_graph(
-        GraphCreateDTO(
-            id="g1",
-            name="Sample",
-            nodes=[NodeDTO(id="n1", payload={"text": "Node 1"})],
-        )
-    )
+    service.create_graph(make_create_dto(nodes=[NodeDTO(id="n1", payload={"text": "Node 1"})]))
 
     assert "g1" in repo.graphs
     assert repo.graphs["g1"].name == "Sample"
     assert "n1" in repo.graphs["g1"].nodes
 
 
-def test_create_graph_with_type():
-    repo = MockGraphRepository()
+@pytest.mark.parametrize(
+    ("dto_kwargs", "attr", "expected"),
+    [({"graph_type": "tree"}, "graph_type", "tree"), ({"directed": False}, "directed", False)],
+)
+def test_create_graph_sets_field(repo_factory, make_create_dto, dto_kwargs, attr, expected):
+    repo = repo_factory()
     service = GraphService(repo)
 
-    created = service.create_graph(GraphCreateDTO(id="g1", name="Sample", graph_type="tree"))
+    created = service.create_graph(make_create_dto(**dto_kwargs))
 
-    assert created.graph_type == "tree"
-    assert repo.graphs["g1"].graph_type == "tree"
+    assert getattr(created, attr) == expected
+    assert getattr(repo.graphs["g1"], attr) == expected
 
 
-def test_create_graph_invalid_type_raises():
-    repo = MockGraphRepository()
+def test_create_graph_invalid_type_raises(repo_factory, make_create_dto):
+    repo = repo_factory()
     service = GraphService(repo)
 
     with pytest.raises(ValueError):
-        service.create_graph(GraphCreateDTO(id="g1", name="Sample", graph_type="invalid"))
+        service.create_graph(make_create_dto(graph_type="invalid"))
 
 
-def test_create_graph_with_directed_flag():
-    repo = MockGraphRepository()
+def test_duplicate_graph_raises(repo_factory, make_create_dto):
+    repo = repo_factory({"g1": Graph(id="g1", name="Existing")})
     service = GraphService(repo)
 
-    created = service.create_graph(GraphCreateDTO(id="g1", name="Sample", directed=False))
+    with pytest.raises(GraphAlreadyExistsError):
+        service.create_graph(make_create_dto())
 
-    assert created.directed is False
-    assert repo.graphs["g1"].directed is False
 
+@pytest.fixture
+def service_with_graph(repo_factory):
+    repo = repo_factory({"g1": Graph(id="g1", name="Before")})
+    return GraphService(repo), repo
 
-def test_duplicate_graph_raises():
-    repo = MockGraphRepository(graphs={"g1": Graph(id="g1", name="Existing")})
-    service = GraphService(repo)
 
-    with pytest.raises(GraphAlreadyExistsError):
-        service.create_graph(GraphCreateDTO(id="g1", name="Sample"))
+@pytest.mark.parametrize(
+    ("dto_kwargs", "attr", "expected"),
+    [
+        ({"name": "After"}, "name", "After"),
+        ({"graph_type": "dag"}, "graph_type", "dag"),
+        ({"directed": False}, "directed", False),
+    ],
+)
+def test_update_graph_changes_field(service_with_graph, dto_kwargs, attr, expected):
+    service, repo = service_with_graph
+
+    updated = service.update_graph("g1", GraphUpdateDTO(**dto_kwargs))
 
+    assert getattr(updated, attr) == expected
+    assert getattr(repo.graphs["g1"], attr) == expected
 
-def test_update_graph_changes_title():
-    repo = MockGraphRepository(graphs={"g1": Graph(id="g1", name="Before")})
+
+def test_replace_graph_snapshot(snapshot, repo_factory):
+    original = Graph(id="g1", name="Before")
+    repo = repo_factory({"g1": original})
     service = GraphService(repo)
 
-    updated = service.update_graph("g1", GraphUpdateDTO(name="After"))
+    restored = service.replace_graph(snapshot)
 
-    assert updated.name == "After"
-    assert repo.graphs["g1"].name == "After"
+    assert restored.name == "After"
+    assert repo.graphs["g1"].graph_type == "hypergraph"
+    assert repo.graphs["g1"].directed is False
 
 
-def test_update_graph_changes_type():
-    repo = MockGraphRepository(graphs={"g1": Graph(id="g1", name="Before")})
+def test_create_node_uses_repository(repo_factory):
+    graph = Graph(id="g1", name="Graph")
+    graph.add_node(Node(id="existing", data={"text": "Existing"}))
+    repo = repo_factory({"g1": graph})
     service = GraphService(repo)
 
-    updated = service.update_graph("g1", GraphUpdateDTO(graph_type="dag"))
+    node = service.create_node("g1", 10.0, 11.0, text="New Node")
 
-    assert updated.graph_type == "dag"
-    assert repo.graphs["g1"].graph_type == "dag"
+    assert node.id in repo.graphs["g1"].nodes
+    assert repo.saved_graph_ids[-1] == "g1"
 
 
-def test_update_graph_changes_directed():
-    repo = MockGraphRepository(graphs={"g1": Graph(id="g1", name="Before")})
+def test_create_node_and_edge_ids_skip_existing(repo_factory):
+    graph = Graph(id="g1", name="Graph")
+    graph.add_node(Node(id="n1f", data={"text": "Loaded"}))
+    graph.add_edge(Edge(id="e1", source_id="n1f", target_id="n1f"))
+    repo = repo_factory({"g1": graph})
     service = GraphService(repo)
 
-    updated = service.update_graph("g1", GraphUpdateDTO(directed=False))
-
-    assert updated.directed is False
-    assert repo.graphs["g1"].directed is False
+    first = service.create_node("g1", text="First")
+    second = service.create_node("g1", text="Second")
+    edge = service.create_edge("g1", first.id, second.id)
 
+    assert (first.id, second.id) == ("n20", "n21")
+    assert edge.id == "e2"
 
-def test_replace_graph_snapshot():
-    original = Graph(id="g1", name="Before")
-    repo = MockGraphRepository(graphs={"g1": original})
-    service = GraphService(repo)
 
-    snapshot = Graph(id="g1", name="After", graph_type="hypergraph", directed=False).to_dict()
+def test_deleted_ids_are_not_reissued_after_reload():
+    graph = Graph(id="g1", name="Graph")
+    graph.add_node(Node(id="n1"))
+    node = graph.create_node()
+    edge = graph.create_edge(node.id, "n1")
+    graph.remove_node(node.id)
 
-    restored = service.replace_graph(snapshot)
+    reloaded = Graph.from_dict(graph.to_dict())
 
-    assert restored.name == "After"
-    assert repo.graphs["g1"].graph_type == "hypergraph"
-    assert repo.graphs["g1"].directed is False
+    assert reloaded.create_node().id == "n3"
+    assert reloaded.create_edge("n1", "n1").id == "e2"
+    assert (node.id, edge.id) == ("n2", "e1")
 
 
-def test_create_node_uses_repository():
-    graph = Graph(id="g1", name="Graph")
-    graph.add_node(Node(id="existing", data={"text": "Existing"}))
-    repo = MockGraphRepository(graphs={"g1": graph})
+@pytest.mark.parametrize("n", [1, 100, 1000])
+def test_patch_node_positions_updates_coordinates(repo_factory, n):
+    nodes = {f"n{i}": Node(id=f"n{i}", data={"x": 0.0, "y": 0.0}) for i in range(n)}
+    repo = repo_factory({"g1": Graph(id="g1", name="Graph", nodes=nodes)})
     service = GraphService(repo)
 
-    node = service.create_node("g1", 10.0, 11.0, text="New Node")
+    updated = service.patch_node_positions(
+        "g1", [(f"n{i}", float(i) + 1, float(i) + 2) for i in range(n)]
+    )
 
-    assert node.id in repo.graphs["g1"].nodes
-    assert repo.saved_graph_ids[-1] == "g1"
+    assert len(updated) == n
+    assert updated[-1] == {"id": f"n{n - 1}", "x": float(n), "y": float(n + 1)}
+    assert repo.graphs["g1"].nodes["n0"].data["x"] == 1.0
+    assert list(repo.saved_graph_ids) == ["g1"]
 
 
-def test_patch_node_positions_updates_coordinates():
-    node = Node(id="n1", data={"x": 0.0, "y": 0.0})
-    graph = Graph(id="g1", name="Graph", nodes={"n1": node})
-    repo = MockGraphRepository(graphs={"g1": graph})
+def test_patch_node_positions_reports_each_moved_node_once(repo_factory):
+    graph = Graph(
+        id="g1",
+        name="Graph",
+        nodes={
+            "n1": Node(id="n1", data={"x": 0.0, "y": 0.0}),
+            "n2": Node(id="n2", data={"x": 1.0, "y": 1.0}),
+        },
+    )
+    repo = repo_factory({"g1": graph})
     service = GraphService(repo)
 
-    updated = service.patch_node_positions("g1", [("n1", 5.0, 6.0)])
+    updated = service.patch_node_positions(
+        "g1", [("n1", 1.0, 1.0), ("n2", 1.0, 1.0), ("n1", 2.0, 3.0), ("missing", 0.0, 0.0)]
+    )
+
+    assert updated == [{"id": "n1", "x": 2.0, "y": 3.0}]
+    assert repo.graphs["g1"].nodes["n2"].data == {"x": 1.0, "y": 1.0}
+
+
+def test_patch_node_positions_skips_save_when_nothing_moved(repo_factory):
+    graph = Graph(id="g1", name="Graph", nodes={"n1": Node(id="n1", data={"x": 1.0, "y": 1.0})})
+    repo = repo_factory({"g1": graph})
+    service = GraphService(repo)
 
-    assert updated[0]["x"] == 5.0
-    assert repo.graphs["g1"].nodes["n1"].data["x"] == 5.0
+    assert service.patch_node_positions("g1", [("n1", 1.0, 1.0), ("missing", 0.0, 0.0)]) == []
+    assert not repo.saved_graph_ids
 
 
-def test_update_node_overwrites_metadata():
+def test_update_node_overwrites_metadata(repo_factory):
     node = Node(id="n1", data={"text": "Old", "metadata": {"color": "red"}})
     graph = Graph(id="g1", name="Graph", nodes={"n1": node})
-    repo = MockGraphRepository(graphs={"g1": graph})
+    repo = repo_factory({"g1": graph})
     service = GraphService(repo)
 
     updated = service.update_node("g1", "n1", {"text": "New", "metadata": {"color": "blue"}})
@@ -156,10 +186,10 @@ def test_update_node_overwrites_metadata():
     assert updated.data["metadata"]["color"] == "blue"
 
 
-def test_update_edge_changes_source_target():
+def test_update_edge_changes_source_target(repo_factory):
     edge = Edge(id="e1", source_id="a", target_id="b", data={"text": "Old"})
     graph = Graph(id="g1", name="Graph", edges={"e1": edge})
-    repo = MockGraphRepository(graphs={"g1": graph})
+    repo = repo_factory({"g1": graph})
     service = GraphService(repo)
 
     updated = service.update_edge("g1", "e1", {"source_id": "x", "target_id": "y", "text": "New"})
@@ -169,27 +199,41 @@ def test_update_edge_changes_source_target():
     assert updated.data["text"] == "New"
 
 
-def test_delete_node_missing_raises():
+def test_delete_node_removes_incident_edges(base_graph, repo_factory):
+    graph = base_graph
+    graph.add_node(Node(id="c"))
+    graph.add_edge(Edge(id="ab", source_id="a", target_id="b"))
+    graph.add_edge(Edge(id="bc", source_id="b", target_id="c"))
+    repo = repo_factory({"g1": graph})
+    service = GraphService(repo)
+
+    service.update_edge("g1", "bc", {"source_id": "a"})
+    service.delete_node("g1", "a")
+
+    assert set(repo.graphs["g1"].nodes) == {"b", "c"}
+    assert repo.graphs["g1"].edges == {}
+
+
+def test_delete_node_missing_raises(repo_factory):
     graph = Graph(id="g1", name="Graph")
-    repo = MockGraphRepository(graphs={"g1": graph})
+    repo = repo_factory({"g1": graph})
     service = GraphService(repo)
 
     with pytest.raises(NodeNotFoundError):
         service.delete_node("g1", "unknown")
 
 
-def test_delete_edge_missing_raises():
+def test_delete_edge_missing_raises(repo_factory):
     graph = Graph(id="g1", name="Graph")
-    repo = MockGraphRepository(graphs={"g1": graph})
+    repo = repo_factory({"g1": graph})
     service = GraphService(repo)
 
     with pytest.raises(EdgeNotFoundError):
         service.delete_edge("g1", "unknown")
 
 
-def test_update_graph_grid_settings():
-    repo = MockGraphRepository(graphs={"g1": Graph(id="g1", name="Graph")})
-    service = GraphService(repo)
+def test_update_graph_grid_settings(service_with_graph):
+    service, repo = service_with_graph
 
     service.update_graph(
         "g1",
@@ -0,0 +1,55 @@
+"""Shared pytest configuration for the test suite."""
+from __future__ import annotations
+
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+_existing = set(sys.path)
+sys.path[:0] = [path for path in (str(SRC), str(ROOT)) if path not in _existing]
+
+from graph_canvas.application.dto import GraphCreateDTO
+from graph_canvas.domain.entities import Graph, Node
+from tests.support.mocks import MockGraphRepository
+
+
+def _base_graph() -> Graph:
+    graph = Graph(id="g1", name="Graph")
+    graph.add_node(Node(id="a", data={"x": 0, "y": 0}))
+    graph.add_node(Node(id="b", data={"x": 10, "y": 10}))
+    return graph
+
+
+# Built once per session; unpickling hands each test an independent copy faster than deepcopy.
+_SNAPSHOT_PICKLE = pickle.dumps(
+    Graph(id="g1", name="After", graph_type="hypergraph", directed=False).to_dict()
+)
+_BASE_GRAPH_PICKLE = pickle.dumps(_base_graph())
+
+
+@pytest.fixture
+def snapshot():
+    """Serialized ``g1`` graph the snapshot tests may mutate freely."""
+    return pickle.loads(_SNAPSHOT_PICKLE)
+
+
+@pytest.fixture
+def base_graph():
+    """Fresh copy of the two-node ``g1`` graph for tests that mutate it."""
+    return pickle.loads(_BASE_GRAPH_PICKLE)
+
+
+@pytest.fixture
+def repo_factory():
+    """Build an isolated repository per call so tests never share mutable state."""
+    return lambda graphs=None: MockGraphRepository(graphs=graphs or {})
+
+
+@pytest.fixture
+def make_create_dto():
+    """GraphCreateDTO factory defaulting to ``id="g1", name="Sample"``."""
+    return lambda **overrides: GraphCreateDTO(**{"id": "g1", "name": "Sample", **overrides})
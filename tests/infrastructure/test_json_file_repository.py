@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import os
+
+import orjson
+import pytest
+
+from graph_canvas.domain.entities import Edge, Graph, Node
+from graph_canvas.domain.exceptions import GraphNotFoundError
+from graph_canvas.infrastructure.repositories.json_file import JsonGraphRepository
+
+
+def _graph(graph_id: str = "g1") -> Graph:
+    graph = Graph(id=graph_id, name="Graph")
+    graph.add_node(Node(id="a", data={"x": 1.0, "y": 2.0}))
+    graph.add_node(Node(id="b"))
+    graph.add_edge(Edge(id="e", source_id="a", target_id="b"))
+    return graph
+
+
+def test_round_trips_graphs_through_file(tmp_path):
+    path = tmp_path / "graphs.json"
+    repo = JsonGraphRepository(path, seed=[_graph()])
+
+    loaded = JsonGraphRepository(path).get_graph("g1")
+
+    assert loaded.to_dict() == _graph().to_dict()
+    assert path.read_bytes().endswith(b"\n")
+    assert not (tmp_path / "graphs.json.tmp").exists()
+
+    repo.delete_graph("g1")
+    with pytest.raises(GraphNotFoundError):
+        repo.get_graph("g1")
+
+
+def test_mutations_are_journaled_and_replayed(tmp_path):
+    path = tmp_path / "graphs.json"
+    repo = JsonGraphRepository(path, seed=[_graph("g1")], compact_interval=60)
+    canonical = path.read_bytes()
+
+    repo.save_graph(_graph("g2"))
+    repo.delete_graph("g1")
+
+    assert path.read_bytes() == canonical
+    journal = (tmp_path / "graphs.ndjson").read_bytes().splitlines()
+    assert len(journal) == 2
+
+    reopened = JsonGraphRepository(path, compact_interval=60)
+    assert [graph.id for graph in reopened.list_graphs()] == ["g2"]
+    assert (tmp_path / "graphs.ndjson").read_bytes() == b""
+
+
+def test_compaction_folds_journal_into_file(tmp_path):
+    path = tmp_path / "graphs.json"
+    repo = JsonGraphRepository(path, compact_interval=60)
+    repo.save_graph(_graph("g1"))
+
+    repo._compact()
+
+    assert (tmp_path / "graphs.ndjson").read_bytes() == b""
+    assert b'"id": "g1"' in path.read_bytes()
+
+
+def test_reloads_when_file_is_replaced_externally(tmp_path):
+    path = tmp_path / "graphs.json"
+    repo = JsonGraphRepository(path, seed=[_graph("g1")], compact_interval=60)
+    assert [graph.id for graph in repo.list_graphs()] == ["g1"]
+
+    path.write_bytes(orjson.dumps([_graph("g2").to_dict()]))
+    os.utime(path, ns=(0, 0))
+
+    assert [graph.id for graph in repo.list_graphs()] == ["g2"]
+
+
+def test_compaction_keeps_entries_appended_while_writing(tmp_path, monkeypatch):
+    path = tmp_path / "graphs.json"
+    repo = JsonGraphRepository(path, compact_interval=60)
+    repo.save_graph(_graph("g1"))
+
+    write = repo._write
+
+    def write_then_save(payload):
+        write(payload)
+        repo.save_graph(_graph("g2"))
+
+    monkeypatch.setattr(repo, "_write", write_then_save)
+    repo._compact()
+
+    assert b'"id": "g2"' not in path.read_bytes()
+    reopened = JsonGraphRepository(path, compact_interval=60)
+    assert [graph.id for graph in reopened.list_graphs()] == ["g1", "g2"]
+
+
+def test_repositories_sharing_a_file_keep_each_others_writes(tmp_path):
+    path = tmp_path / "graphs.json"
+    first = JsonGraphRepository(path, compact_interval=60)
+    second = JsonGraphRepository(path, compact_interval=60)
+
+    first.save_graph(_graph("g1"))
+    second.save_graph(_graph("g2"))
+    second._compact()
+    first.save_graph(_graph("g3"))
+    first._compact()
+
+    reopened = JsonGraphRepository(path, compact_interval=60)
+    assert sorted(graph.id for graph in reopened.list_graphs()) == ["g1", "g2", "g3"]
+
+
+def test_reads_pick_up_entries_journaled_by_another_repository(tmp_path):
+    path = tmp_path / "graphs.json"
+    reader = JsonGraphRepository(path, seed=[_graph("g1")], compact_interval=60)
+    writer = JsonGraphRepository(path, compact_interval=60)
+
+    writer.save_graph(_graph("g2"))
+
+    assert [graph.id for graph in reader.list_graphs()] == ["g1", "g2"]
+
+
+def test_close_compacts_the_journal(tmp_path):
+    path = tmp_path / "graphs.json"
+    repo = JsonGraphRepository(path, compact_interval=60)
+    repo.save_graph(_graph("g1"))
+
+    repo.close()
+
+    assert (tmp_path / "graphs.ndjson").read_bytes() == b""
+    assert b'"id": "g1"' in path.read_bytes()
+
+
+def test_graph_dicts_match_entity_serialization(tmp_path):
+    repo = JsonGraphRepository(tmp_path / "graphs.json", seed=[_graph("g1")])
+    expected = orjson.loads(orjson.dumps(_graph("g1").to_dict()))
+
+    assert repo.list_graph_dicts() == [expected]
+    assert repo.get_graph_dict("g1") == expected
+    with pytest.raises(GraphNotFoundError):
+        repo.get_graph_dict("missing")
+
+
+def test_numpy_values_in_node_data_are_persisted(tmp_path):
+    np = pytest.importorskip("numpy")
+    repo = JsonGraphRepository(tmp_path / "graphs.json", compact_interval=60)
+    graph = _graph("g1")
+    graph.nodes["a"].data["weights"] = np.array([0.5, 1.5])
+
+    repo.save_graph(graph)
+
+    assert repo.get_graph_dict("g1")["nodes"][0]["weights"] == [0.5, 1.5]
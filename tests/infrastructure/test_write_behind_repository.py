@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+
+from graph_canvas.domain.entities import Graph, Node
+from graph_canvas.infrastructure.repositories.write_behind import (
+    WriteBehindGraphRepository,
+)
+from tests.support.mocks import MockGraphRepository
+
+
+def test_repeated_saves_are_written_once_on_flush(repo_factory):
+    inner = repo_factory()
+    repo = WriteBehindGraphRepository(inner, delay=60)
+    graph = Graph(id="g", name="G")
+
+    for index in range(5):
+        graph.add_node(Node(id=f"n{index}"))
+        repo.save_graph(graph)
+
+    assert list(inner.saved_graph_ids) == []
+    assert repo.get_graph("g") is not graph
+    assert repo.get_graph("g").to_dict() == graph.to_dict()
+    assert [g.id for g in repo.list_graphs()] == ["g"]
+
+    repo.flush()
+    assert list(inner.saved_graph_ids) == ["g"]
+    assert len(inner.get_graph("g").nodes) == 5
+
+    repo.flush()
+    assert list(inner.saved_graph_ids) == ["g"]
+
+
+def test_delete_discards_pending_graph(repo_factory):
+    inner = repo_factory()
+    repo = WriteBehindGraphRepository(inner, delay=60)
+    repo.save_graph(Graph(id="g", name="G"))
+
+    repo.delete_graph("g")
+    repo.flush()
+
+    assert list(inner.saved_graph_ids) == []
+    assert list(repo.list_graphs()) == []
+
+
+def test_graph_dicts_prefer_pending_saves(repo_factory):
+    inner = repo_factory()
+    inner.save_graph(Graph(id="g", name="Old"))
+    repo = WriteBehindGraphRepository(inner, delay=60)
+
+    repo.save_graph(Graph(id="g", name="New"))
+    repo.save_graph(Graph(id="h", name="H"))
+
+    assert [payload["name"] for payload in repo.list_graph_dicts()] == ["New", "H"]
+    assert repo.get_graph_dict("g")["name"] == "New"
+
+
+def test_delete_during_flush_is_not_undone():
+    entered, release = threading.Event(), threading.Event()
+
+    class SlowRepository(MockGraphRepository):
+        def save_graph(self, graph):
+            entered.set()
+            release.wait(5)
+            return MockGraphRepository.save_graph(self, graph)
+
+    inner = SlowRepository()
+    repo = WriteBehindGraphRepository(inner, delay=60)
+    repo.save_graph(Graph(id="g", name="G"))
+
+    flusher = threading.Thread(target=repo.flush)
+    flusher.start()
+    assert entered.wait(5)
+    deleter = threading.Thread(target=repo.delete_graph, args=("g",))
+    deleter.start()
+    release.set()
+    flusher.join(5)
+    deleter.join(5)
+
+    assert "g" not in inner.graphs
+    assert list(inner.deleted_graph_ids) == ["g"]
@@ -1,41 +1,59 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+import json
 
+import msgspec
+import pytest
 from fastapi.testclient import TestClient
 
-ROOT = Path(__file__).resolve().parents[3]
-SRC = ROOT / "src"
-for path in (ROOT, SRC):
-    path_str = str(path)
-    if path_str not in sys.path:
-        sys.path.insert(0, path_str)
-
 from graph_canvas.application.graph_service import GraphService
-from graph_canvas.domain.entities import Graph, Node
+from graph_canvas.domain.entities import Edge, Graph, Node
 from graph_canvas.presentation.api.app import create_api_app
 from tests.support.mocks import MockGraphRepository
 
 
-def make_app(graphs=None):
-    repo = MockGraphRepository(graphs=graphs or {})
+@pytest.fixture(scope="module")
+def app_and_repo():
+    repo = MockGraphRepository()
+    app = create_api_app(GraphService(repo))
+    return app, repo
+
 
-    def _get_service():
-        from graph_canvas.application.graph_service import GraphService
+@pytest.fixture
+def repo(app_and_repo):
+    return app_and_repo[1]
 
-        return GraphService(repo)
 
-    app = create_api_app(_get_service())
-    app.state.repo = repo
-    return app, repo
+@pytest.fixture(scope="module")
+def client(app_and_repo):
+    with TestClient(app_and_repo[0]) as client:
+        yield client
 
 
-def test_list_graphs_returns_seed():
+@pytest.fixture(autouse=True)
+def reset(repo):
+    yield
+    repo.graphs.clear()
+    repo.saved_graph_ids.clear()
+    repo.deleted_graph_ids.clear()
+
+
+def install_snapshot(client, graph):
+    response = client.put(f"/graphs/{graph.id}/snapshot", json=graph.to_dict())
+    assert response.status_code == 200
+    return graph
+
+
+@pytest.fixture
+def seeded(client, base_graph):
+    base_graph.add_edge(Edge(id="ab", source_id="a", target_id="b", data={"text": "edge"}))
+    return install_snapshot(client, base_graph)
+
+
+def test_list_graphs_returns_seed(client, repo):
     graph = Graph(id="one", name="One")
     graph.add_node(Node(id="n1", data={"text": "Node"}))
-    app, _ = make_app({"one": graph})
-    client = TestClient(app)
+    repo.graphs["one"] = graph
 
     response = client.get("/graphs")
 
@@ -45,10 +63,19 @@ def test_list_graphs_returns_seed():
     assert data[0]["nodes"][0]["text"] == "Node"
 
 
-def test_create_graph_persists():
-    app, repo = make_app()
-    client = TestClient(app)
+def test_stream_graphs_emits_one_line_per_graph(client, repo):
+    repo.graphs.update({"one": Graph(id="one", name="One"), "two": Graph(id="two", name="Two")})
+
+    response = client.get("/graphs.ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == ["one", "two"]
+    assert lines[0]["background_color"] == [255, 255, 255]
+
 
+def test_create_graph_persists(client, repo):
     payload = {
         "id": "g2",
         "name": "Created",
@@ -66,20 +93,14 @@ def test_create_graph_persists():
     assert response.json()["directed"] is False
 
 
-def test_create_graph_rejects_invalid_type():
-    app, _ = make_app()
-    client = TestClient(app)
-
+def test_create_graph_rejects_invalid_type(client):
     payload = {"id": "g3", "name": "Bad", "graph_type": "invalid", "nodes": [], "edges": []}
     response = client.post("/graphs", json=payload)
 
     assert response.status_code == 422
 
 
-def test_compat_graph_roundtrip():
-    app, repo = make_app()
-    client = TestClient(app)
-
+def test_compat_graph_roundtrip(client, repo):
     response = client.get("/graph")
     assert response.status_code == 200
 
@@ -89,12 +110,33 @@ def test_compat_graph_roundtrip():
 
     assert repo.graphs["workspace"].name == "Updated Workspace"
 
+    response = client.post("/graph", json={"nodes": "not-a-list"})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    ("path", "method"),
+    [
+        ("/graph", "post"),
+        ("/nodes/positions", "patch"),
+        ("/graphs/{graph_id}/nodes/positions", "patch"),
+        ("/graphs/{graph_id}/snapshot:raw", "put"),
+    ],
+)
+def test_raw_body_routes_document_their_request_body(client, path, method):
+    spec = client.get("/openapi.json").json()
+    schemas = spec["components"]["schemas"]
 
-def test_compat_create_node():
+    body = spec["paths"][path][method]["requestBody"]
+
+    schema = body["content"]["application/json"]["schema"]
+    refs = [schema.get("$ref")] + [option.get("$ref") for option in schema.get("anyOf", [])]
+    assert any(ref and ref.rsplit("/", 1)[-1] in schemas for ref in refs)
+
+
+def test_compat_create_node(client, repo):
     graph = Graph(id="workspace", name="Workspace")
-    repo = MockGraphRepository(graphs={"workspace": graph})
-    app = create_api_app(GraphService(repo))  # type: ignore[name-defined]
-    client = TestClient(app)
+    repo.graphs["workspace"] = graph
 
     response = client.post("/nodes", json={"x": 1.0, "y": 2.0, "text": "hello"})
 
@@ -103,59 +145,83 @@ def test_compat_create_node():
     assert data["text"] == "hello"
 
 
-def test_node_crud_endpoints():
-    graph = Graph(id="g1", name="Graph")
-    repo = MockGraphRepository(graphs={"g1": graph})
-    app = create_api_app(GraphService(repo))  # type: ignore[name-defined]
-    client = TestClient(app)
+def test_create_node_endpoint(client, repo):
+    install_snapshot(client, Graph(id="g1", name="Graph"))
+
+    response = client.post(
+        "/graphs/g1/nodes",
+        json={"text": "Node A", "x": 10, "y": 20, "label": None, "color": [1, 2, 3]},
+    )
+
+    assert response.status_code == 201
+    node_id = response.json()["id"]
+    assert response.json()["color"] == [1, 2, 3]
+    assert "label" not in repo.graphs["g1"].nodes[node_id].data
 
-    create_res = client.post("/graphs/g1/nodes", json={"text": "Node A", "x": 10, "y": 20})
-    assert create_res.status_code == 201
-    node_id = create_res.json()["id"]
 
-    patch_res = client.patch(f"/graphs/g1/nodes/{node_id}", json={"text": "Node B"})
-    assert patch_res.status_code == 200
-    assert patch_res.json()["text"] == "Node B"
+def test_update_node_endpoint(client, seeded):
+    response = client.patch("/graphs/g1/nodes/a", json={"text": "Node B"})
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "Node B"
 
-    positions_res = client.patch(
+
+def test_patch_node_positions_endpoint(client, seeded):
+    wrapped = client.patch(
         "/graphs/g1/nodes/positions",
-        json={"positions": [{"id": node_id, "x": 50, "y": 60}]},
+        json={"positions": [{"id": "a", "x": 50, "y": 60}]},
     )
-    assert positions_res.status_code == 200
-    assert positions_res.json()["updated"][0]["x"] == 50
+    assert wrapped.status_code == 200
+    assert wrapped.json()["updated"][0]["x"] == 50
 
-    delete_res = client.delete(f"/graphs/g1/nodes/{node_id}")
-    assert delete_res.status_code == 204
+    bare = client.patch("/graphs/g1/nodes/positions", json=[{"id": "a", "x": 70, "y": 80}])
+    assert bare.json()["updated"][0]["y"] == 80
 
+    invalid = client.patch("/graphs/g1/nodes/positions", json={"nodes": []})
+    assert invalid.status_code == 422
 
-def test_edge_crud_endpoints():
-    graph = Graph(id="g1", name="Graph")
-    graph.add_node(Node(id="a", data={"x": 0, "y": 0}))
-    graph.add_node(Node(id="b", data={"x": 10, "y": 10}))
-    repo = MockGraphRepository(graphs={"g1": graph})
-    app = create_api_app(GraphService(repo))  # type: ignore[name-defined]
-    client = TestClient(app)
+    packed = client.patch(
+        "/graphs/g1/nodes/positions",
+        content=msgspec.msgpack.encode([("a", 90, 100)]),
+        headers={"Content-Type": "application/msgpack"},
+    )
+    assert packed.json()["updated"][0]["x"] == 90
+
+
+def test_delete_node_endpoint(client, repo, seeded):
+    response = client.delete("/graphs/g1/nodes/a")
 
-    create_res = client.post(
+    assert response.status_code == 204
+    assert set(repo.graphs["g1"].nodes) == {"b"}
+
+
+def test_create_edge_endpoint(client, seeded):
+    response = client.post(
         "/graphs/g1/edges",
-        json={"source_id": "a", "target_id": "b", "text": "edge"},
+        json={"source_id": "b", "target_id": "a", "text": "back"},
     )
-    assert create_res.status_code == 201
-    edge_id = create_res.json()["id"]
 
-    patch_res = client.patch(f"/graphs/g1/edges/{edge_id}", json={"text": "updated"})
-    assert patch_res.status_code == 200
-    assert patch_res.json()["text"] == "updated"
+    assert response.status_code == 201
+    assert response.json()["source_id"] == "b"
+
+
+def test_update_edge_endpoint(client, seeded):
+    response = client.patch("/graphs/g1/edges/ab", json={"text": "updated"})
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "updated"
 
-    delete_res = client.delete(f"/graphs/g1/edges/{edge_id}")
-    assert delete_res.status_code == 204
 
+def test_delete_edge_endpoint(client, repo, seeded):
+    response = client.delete("/graphs/g1/edges/ab")
 
-def test_update_graph_type_endpoint():
+    assert response.status_code == 204
+    assert repo.graphs["g1"].edges == {}
+
+
+def test_update_graph_type_endpoint(client, repo):
     graph = Graph(id="g1", name="Graph")
-    repo = MockGraphRepository(graphs={"g1": graph})
-    app = create_api_app(GraphService(repo))  # type: ignore[name-defined]
-    client = TestClient(app)
+    repo.graphs["g1"] = graph
 
     response = client.patch("/graphs/g1", json={"graph_type": "dag", "directed": False})
 
@@ -166,17 +232,10 @@ def test_update_graph_type_endpoint():
     assert repo.graphs["g1"].directed is False
 
 
-def test_replace_graph_snapshot_endpoint():
-    graph = Graph(id="g1", name="Graph")
-    graph.add_node(Node(id="a", data={"x": 0, "y": 0, "text": "A"}))
-    repo = MockGraphRepository(graphs={"g1": graph})
-    app = create_api_app(GraphService(repo))  # type: ignore[name-defined]
-    client = TestClient(app)
+def test_replace_graph_snapshot_endpoint(client, repo, snapshot):
+    repo.graphs["g1"] = Graph(id="g1", name="Graph")
 
-    snapshot = graph.to_dict()
     snapshot["name"] = "Restored"
-    snapshot["graph_type"] = "hypergraph"
-    snapshot["directed"] = False
 
     response = client.put("/graphs/g1/snapshot", json=snapshot)
 
@@ -185,3 +244,18 @@ def test_replace_graph_snapshot_endpoint():
     assert repo.graphs["g1"].graph_type == "hypergraph"
     assert repo.graphs["g1"].directed is False
 
+
+def test_replace_graph_snapshot_raw_endpoint(client, repo, snapshot):
+    repo.graphs["g1"] = Graph(id="g1", name="Graph")
+
+    snapshot["name"] = "Streamed"
+    snapshot["nodes"] = [{"id": "a", "x": 1, "y": 2}]
+
+    response = client.put("/graphs/g1/snapshot:raw", json=snapshot)
+
+    assert response.status_code == 200
+    assert response.json()["nodes"] == [{"id": "a", "x": 1, "y": 2}]
+    assert repo.graphs["g1"].name == "Streamed"
+
+    bad = client.put("/graphs/g1/snapshot:raw", content=b"[1, 2")
+    assert bad.status_code == 422
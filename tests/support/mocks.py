@@ -1,18 +1,7 @@
 """Simple mocks to support unit tests."""
 from __future__ import annotations
 
-from pathlib import Path
-import sys
-
-ROOT = Path(__file__).resolve().parents[2]
-SRC = ROOT / "src"
-for path in (ROOT, SRC):
-    path_str = str(path)
-    if path_str not in sys.path:
-        sys.path.insert(0, path_str)
-
-
-
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, Iterable
 
@@ -25,11 +14,11 @@ class MockGraphRepository(GraphRepository):
     """GraphRepository double that records interactions."""
 
     graphs: Dict[str, Graph] = field(default_factory=dict)
-    saved_graph_ids: list[str] = field(default_factory=list)
-    deleted_graph_ids: list[str] = field(default_factory=list)
+    saved_graph_ids: deque[str] = field(default_factory=deque)
+    deleted_graph_ids: deque[str] = field(default_factory=deque)
 
     def list_graphs(self) -> Iterable[Graph]:
-        return list(self.graphs.values())
+        return self.graphs.values()
 
     def get_graph(self, graph_id: str) -> Graph:
         return self.graphs[graph_id]